@@ -4,4 +4,15 @@ Ada module for the Agentic Digital Assistant
 This module provides the main entry point for the Ada agent system
 """
 
-from ada.agent import Agent as Agent
+__all__ = ["Agent"]
+
+
+def __getattr__(name: str):
+    # Agent pulls in every backend SDK, so it isn't imported until it's used
+    if name != "Agent":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from ada.agent import Agent
+
+    globals()["Agent"] = Agent
+    return Agent
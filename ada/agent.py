@@ -15,8 +15,7 @@ from ada.tool_box import ToolBox
 from ada.exceptions import TerminateTaskGroup
 from ada.looper import Looper
 from ada.formatter import block
-from ada.backends import Base as Backend, LlamaCppBackend, OllamaBackend
-from ada.voice import Voice
+from ada.backends import Base as Backend
 
 
 WHOAMI = "ADA"
@@ -41,7 +40,10 @@ class Agent:
         self.conversation: Conversation = Conversation(record=config.record())
         self.persona = Personas.DEFAULT
         if config.voice():
-            self.voice = Voice(config.voice())  # pyright: ignore[reportArgumentType] not bool under if
+            # piper, onnxruntime and pyaudio are only loaded when tts is enabled
+            from ada.voice import Voice
+
+            self.voice = Voice(config.voice(), use_cuda=config.voice_cuda())  # pyright: ignore[reportArgumentType] not bool under if
             self.voice.say("Hello World!")
         self.__init_prompt(config)
 
@@ -70,14 +72,28 @@ class Agent:
                 logger.error(f"unhandled exception group: {eg}")
                 raise
         finally:
+            self.conversation.flush()
+            if self.config.voice():
+                self.voice.wait()  # let queued speech finish playing
+                self.voice.close()
             logger.info("stopping")
 
     def say(self, input: str) -> None:
-        print(f"{WHOAMI}: {input}")
+        self.__print(input)
 
         if self.config.voice():
             self.voice.say(input)
 
+    async def say_async(self, input: str) -> None:
+        """Like say(), but speech synthesis runs off the event loop."""
+        self.__print(input)
+
+        if self.config.voice():
+            await self.voice.say_async(input)
+
+    def __print(self, input: str) -> None:
+        print(f"{WHOAMI}: {input}")
+
     async def __switch_persona(self, name: str, looper: Looper) -> bool:
         """
         Switch to a different persona by name.
@@ -113,14 +129,19 @@ class Agent:
 
         logger.info(f"building backend: {backend}")
 
+        # only the configured backend's SDK is imported
         if backend == "llama-cpp":
+            from ada.backends import LlamaCppBackend
+
             return LlamaCppBackend(backend_config)
         elif backend == "ollama":
+            from ada.backends import OllamaBackend
+
             return OllamaBackend(backend_config)
         else:
             raise ValueError(f"Unknown backend: {backend}")
 
-    def __show_help(self) -> None:
+    async def __show_help(self) -> None:
         """Display available commands and their descriptions."""
         help_text = dedent("""\
         Available Commands:
@@ -137,9 +158,9 @@ class Agent:
         /exit, /quit, /bye  - Exit the chat
         """)
 
-        self.say(help_text)
+        await self.say_async(help_text)
 
-    def __show_backends(self) -> None:
+    async def __show_backends(self) -> None:
         """Display current backend and list available backends."""
         current_backend = self.config.backend()
         available_backends = list(self.config.loaded.get("backends", {}).keys())
@@ -151,9 +172,9 @@ class Agent:
             marker = "*" if backend == current_backend else " "
             output += f"  {marker} {backend}\n"
 
-        self.say(output)
+        await self.say_async(output)
 
-    def __show_models(self) -> None:
+    async def __show_models(self) -> None:
         """Display current model and list available models."""
         current_model = self.backend.current_model()
         available_models = self.backend.available_models()
@@ -164,7 +185,7 @@ class Agent:
             marker = "*" if model == current_model else " "
             output += f"  {marker} {model}\n"
 
-        self.say(output)
+        await self.say_async(output)
 
     async def __scan_commands(self, query: str, looper: Looper) -> bool:
         """
@@ -178,7 +199,7 @@ class Agent:
         """
         neat = query.lower().strip()
         if neat == "/help" or neat == "/?":
-            self.__show_help()
+            await self.__show_help()
             return True
         elif neat == "/clear":
             self.conversation.clear()
@@ -187,10 +208,10 @@ class Agent:
             print(self.conversation)
             return True
         elif neat == "/tools":
-            self.__list_tools()
+            await self.__list_tools()
             return True
         elif neat == "/prompt":
-            self.say(
+            await self.say_async(
                 "\n"
                 + block("SYSTEM PROMPT")
                 + self.__system_prompt()["content"]
@@ -203,7 +224,7 @@ class Agent:
             available_personas = ""
             for persona in Personas.all():
                 available_personas += str(persona) + "\n"
-            self.say(
+            await self.say_async(
                 f"{current}\nAvailable personas:\n\n{available_personas}\nUse `/switch [name]` to change personas."
             )
             return True
@@ -211,21 +232,21 @@ class Agent:
             persona_name = query[8:].strip()  # Remove "/switch " prefix
             switched = await self.__switch_persona(persona_name, looper)
             if switched:
-                self.say(f"Switched to persona {self.persona.name}")
+                await self.say_async(f"Switched to persona {self.persona.name}")
             else:
-                self.say(
+                await self.say_async(
                     f"Persona '{persona_name}' not found. Use '/personas' to see available personas."
                 )
             return True
         elif neat == "/backends" or neat == "/backend":
-            self.__show_backends()
+            await self.__show_backends()
             return True
         elif neat == "/models" or neat == "/model":
-            self.__show_models()
+            await self.__show_models()
             return True
         return False
 
-    def __process_message(self, query: str):
+    async def __process_message(self, query: str):
         """
         Process a user message and generate a response.
 
@@ -241,7 +262,8 @@ class Agent:
             logger.warning(f"usage exceed 75% of max {self.max_content_length}.")
 
         self.conversation.append_response(WHOAMI, response)
-        self.say(response.body)
+        self.conversation.flush()  # write each completed turn to the record
+        await self.say_async(response.body)
 
     async def __event_consumer(self, queue: Queue):
         """Consumes file system events."""
@@ -265,10 +287,10 @@ class Agent:
             elif await self.__scan_commands(query, looper):
                 continue  # command was handled by __scan_commands
             elif query.lower().strip() in ("/exit", "/quit", "/bye"):
-                self.say("Goodbye")
+                await self.say_async("Goodbye")
                 break
             else:
-                self.__process_message(query)
+                await self.__process_message(query)
 
         raise TerminateTaskGroup
 
@@ -301,10 +323,10 @@ class Agent:
             "content": system_prompt.strip(),
         }
 
-    def __list_tools(self) -> None:
+    async def __list_tools(self) -> None:
         output = "Available tools:\n\n"
         output += "\n".join([str(tool) for tool in ToolBox.tools])
-        self.say(output)
+        await self.say_async(output)
 
     def __swap_persona(self, looper: Looper, persona: Persona) -> None:
         if self.persona is not None:
@@ -1,5 +1,20 @@
+from importlib import import_module
+
 from .base import Base
-from .llama_cpp_backend import LlamaCppBackend
-from .ollama_backend import OllamaBackend
+
+# the backend SDKs (llama_cpp, ollama) are only imported once a backend is used
+LAZY_BACKENDS = {
+    "LlamaCppBackend": ".llama_cpp_backend",
+    "OllamaBackend": ".ollama_backend",
+}
 
 __all__ = ["Base", "LlamaCppBackend", "OllamaBackend"]
+
+
+def __getattr__(name: str):
+    if name not in LAZY_BACKENDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    backend = getattr(import_module(LAZY_BACKENDS[name], __name__), name)
+    globals()[name] = backend
+    return backend
@@ -5,7 +5,7 @@ This module provides the Base class that all backend implementations should inhe
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Mapping
 
 
 class Base(ABC):
@@ -17,12 +17,12 @@ class Base(ABC):
     method to implement their specific backend logic.
     """
 
-    def __init__(self, config: dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         """
         Initialize the backend.
 
         Args:
-            config: A dictionary containing backend-specific configuration
+            config: A mapping containing backend-specific configuration
         """
         self.config = config
 
@@ -4,7 +4,7 @@ llama-cpp-python backend implementation.
 This module provides the LlamaCppBackend class for running local GGUF models.
 """
 
-from typing import Any, List, cast, Optional, Union, Iterator
+from typing import Any, List, Mapping, cast, Optional, Union, Iterator
 from llama_cpp import (
     Llama,
     ChatCompletionRequestMessage,
@@ -29,7 +29,7 @@ class LlamaCppBackend(Base):
     This backend downloads and runs GGUF models locally using the llama.cpp library.
     """
 
-    def __init__(self, config: dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         """
         Initialize the llama-cpp-python backend.
 
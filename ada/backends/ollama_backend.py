@@ -10,7 +10,7 @@ import ollama
 from ollama import ChatResponse
 from ollama._types import Message
 
-from typing import Any
+from typing import Any, Mapping
 
 from .base import Base
 from ada.logger import build_logger
@@ -26,7 +26,7 @@ class OllamaBackend(Base):
     Ollama must be running separately (e.g., `ollama serve`).
     """
 
-    def __init__(self, config: dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         """
         Initialize the Ollama backend.
 
@@ -1,6 +1,46 @@
 import logging
-import json
-from typing import Any
+import orjson
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts and lists to read-only mappings and tuples.
+
+    Args:
+        value: A parsed JSON value
+
+    Returns:
+        The same data, which can no longer be modified in place
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=32)
+def load_config(path: str, mtime_ns: int, size: int) -> MappingProxyType:
+    """
+    Parse a JSON config file, shared by every Config reading the same revision.
+
+    The result is frozen, as every Config (including the one behind each
+    logger) holds the same object.
+
+    Args:
+        path: Path to the config file
+        mtime_ns: Modification time of the file, so edits are picked up
+        size: Size of the file, catching rewrites within one mtime tick
+
+    Returns:
+        The parsed configuration as a read-only mapping
+    """
+    with open(path, "rb") as f:
+        return freeze(orjson.loads(f.read()))
 
 
 class Config:
@@ -8,15 +48,25 @@ class Config:
 
     def __init__(self, path: str | None = None):
         self.config_path: str = path or self.DEFAULT_PATH
-        self.loaded: dict = self.__init__load(self.config_path)
+        self.loaded = self.__init__load(self.config_path)
+
+    @property
+    def loaded(self) -> Mapping[str, Any]:
+        return self.__loaded
 
-    def __init__load(self, path: str) -> dict:
-        with open(path, "r") as f:
-            return json.load(f)
+    @loaded.setter
+    def loaded(self, loaded: Mapping[str, Any]) -> None:
+        self.__loaded = loaded
+        self.__backend_configs: dict[str, Mapping[str, Any]] = {}
+        self.__log_level: int = getattr(logging, loaded.get("log_level", "WARNING"))
+        self.__voice: str | bool = loaded.get("tts") or False
+
+    def __init__load(self, path: str) -> MappingProxyType:
+        stat = os.stat(path)
+        return load_config(path, stat.st_mtime_ns, stat.st_size)
 
     def log_level(self) -> int:
-        level = self.loaded["log_level"] if "log_level" in self.loaded else "WARNING"
-        return getattr(logging, level)
+        return self.__log_level
 
     def record(self) -> bool:
         return "record" in self.loaded and self.loaded["record"]
@@ -32,8 +82,16 @@ class Config:
             Voice model string (e.g., "en_US-amy-medium") if present and not blank,
             otherwise False
         """
-        tts = self.loaded.get("tts", "")
-        return tts if tts else False
+        return self.__voice
+
+    def voice_cuda(self) -> bool | None:
+        """
+        Get whether TTS synthesis should run on the GPU.
+
+        Returns:
+            The "tts_cuda" setting if present, otherwise None to auto-detect
+        """
+        return self.loaded.get("tts_cuda")
 
     def backend(self) -> str:
         """
@@ -44,7 +102,7 @@ class Config:
         """
         return self.loaded.get("backend", "llama-cpp")
 
-    def backend_config(self, backend: str | None = None) -> dict[str, Any]:
+    def backend_config(self, backend: str | None = None) -> Mapping[str, Any]:
         """
         Get the raw backend-specific configuration.
 
@@ -52,18 +110,20 @@ class Config:
             backend: Optional backend name. If None, uses the configured backend.
 
         Returns:
-            Dictionary with the raw backend configuration from the config file
+            Read-only mapping with the raw backend configuration from the config file
         """
         backend = backend or self.backend()
-        return self.__get_backend_config_for(backend)
+        if backend not in self.__backend_configs:
+            self.__backend_configs[backend] = self.__get_backend_config_for(backend)
+        return self.__backend_configs[backend]
 
-    def __get_backends_config(self) -> dict[str, Any]:
+    def __get_backends_config(self) -> Mapping[str, Any]:
         """Get the backends configuration object."""
         if "backends" not in self.loaded:
             raise ValueError("Missing 'backends' configuration")
         return self.loaded["backends"]
 
-    def __get_backend_config_for(self, backend: str) -> dict[str, Any]:
+    def __get_backend_config_for(self, backend: str) -> Mapping[str, Any]:
         """
         Get backend configuration for a specific backend.
 
@@ -71,7 +131,7 @@ class Config:
             backend: The backend name (e.g., "llama-cpp", "ollama")
 
         Returns:
-            Dictionary with the backend configuration
+            Read-only mapping with the backend configuration
 
         Raises:
             ValueError: If the backend configuration is missing
@@ -87,4 +147,6 @@ if __name__ == "__main__":
 
     print(f"CONFIG_PATH: {config.config_path}")
     print("Loaded:")
-    print(json.dumps(config.loaded, indent=4))
+    print(
+        orjson.dumps(config.loaded, default=dict, option=orjson.OPT_INDENT_2).decode()
+    )
@@ -1,9 +1,11 @@
-import json
+import orjson
 import time
 import uuid
+import weakref
 
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import ClassVar
 
 from ada.entry import Entry
 from ada.formatter import block
@@ -13,6 +15,23 @@ from ada.response import Response
 logger = build_logger(__name__)
 
 
+def write_record(record_path: str, pending: list[Entry]) -> None:
+    """
+    Append buffered entries to a JSON Lines record file and empty the buffer.
+
+    Args:
+        record_path: The record file to append to
+        pending: Entries not yet written, cleared once saved
+    """
+    if not pending:
+        return
+
+    logger.info(f"saving to record file: {record_path}")
+    with open(record_path, "ab") as f:
+        f.write(b"".join(orjson.dumps(entry) + b"\n" for entry in pending))
+    pending.clear()
+
+
 # TODO: need to store metadata, for instance, namable conversations
 # TODO: need to store tool calls ( and maybe outputs )
 class Conversation(BaseModel):
@@ -21,6 +40,8 @@ class Conversation(BaseModel):
     """
 
     STORAGE_PATH: str = "conversations"
+    # entries buffered before writing, the agent also flushes after every turn
+    FLUSH_THRESHOLD: ClassVar[int] = 8
 
     history: list[Entry] = Field(
         default_factory=list,
@@ -33,13 +54,20 @@ class Conversation(BaseModel):
     record_path: str | None = None
     storage_path: str | None = None
 
+    _pending: list[Entry] = PrivateAttr(default_factory=list)
+    _messages: list[dict] = PrivateAttr(default_factory=list)
+
     def __init__(self, **data) -> None:
         super().__init__(**data)
+        self._messages = [entry.message() for entry in self.history]
 
         if self.record:
             self.__init_storage_path()
             logger.info(f"recording conversation to: {self.storage_path}")
             self.record_path = self.storage_path + "/" + self.__generate_file_name()  # pyright: ignore[reportOptionalOperand]
+            # holds the path and buffer rather than self, so an unused
+            # conversation can still be collected, flushing when it is or at exit
+            weakref.finalize(self, write_record, self.record_path, self._pending)
 
     def __init_storage_path(self) -> None:
         if self.storage_path is None:
@@ -50,8 +78,9 @@ class Conversation(BaseModel):
     def append(self, author: str, body: str) -> None:
         entry = Entry(author=author, body=body)
         self.history.append(entry)
+        self._messages.append(entry.message())
         if self.record:
-            self.__save_record()
+            self.__save_record(entry)
 
     def append_response(self, author: str, response: Response) -> None:
         entry = Entry(
@@ -61,43 +90,42 @@ class Conversation(BaseModel):
             content=response.content,
         )
         self.history.append(entry)
+        self._messages.append(entry.message())
         if self.record:
-            self.__save_record()
+            self.__save_record(entry)
 
     def clear(self) -> None:
-        self.history = []
+        self.history.clear()
+        self._messages.clear()
+        self._pending.clear()
         if self.record:
             self.__remove_record()
         print(block("HISTORY CLEARED").strip())
 
+    def flush(self) -> None:
+        """Write buffered entries to the JSON Lines record file"""
+        if self.record_path is not None:
+            write_record(self.record_path, self._pending)
+
     def messages(self) -> list[dict]:
-        return [entry.message() for entry in self.history]
+        # copied because the agent prepends the system prompt to the list
+        return list(self._messages)
 
     def __str__(self) -> str:
-        output = ""
-        output += block("HISTORY START")
-        for entry in self.history:
-            output += str(entry) + "\n"
-        output += block("HISTORY END")
-        return output.strip()
+        entries = (f"{entry}\n" for entry in self.history)
+        return "".join((block("HISTORY START"), *entries, block("HISTORY END"))).strip()
 
     def __generate_file_name(self) -> str:
-        timestamp = int(time.time())
-        unique_id = str(uuid.uuid4())
-        return f"{timestamp}-{unique_id}.json"
-
-    def __save_record(self) -> None:
-        """Save current history to JSON file"""
-        history_data = []
-        for entry in self.history:
-            history_data.append(entry.model_dump())
+        return f"{time.time_ns()}_{uuid.uuid4().hex}.jsonl"
 
-        logger.info(f"saving to record file: {self.record_path}")
-        with open(self.record_path, "w") as f:  # pyright: ignore[reportCallIssue,reportArgumentType]
-            json.dump(history_data, f, indent=4)
+    def __save_record(self, entry: Entry) -> None:
+        """Buffer an entry, writing the batch once FLUSH_THRESHOLD is reached"""
+        self._pending.append(entry)
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
 
     def __remove_record(self) -> None:
         """Remove the history file"""
-        if self.record_path and Path(self.record_path).exists():
+        if self.record_path:
             logger.info(f"removing record file: {self.record_path}")
-            Path(self.record_path).unlink()
+            Path(self.record_path).unlink(missing_ok=True)
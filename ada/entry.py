@@ -1,7 +1,10 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
+import orjson
 
-class Entry(BaseModel):
+
+@dataclass(slots=True)
+class Entry:
     """
     A structured entry in a Conversation
     """
@@ -22,5 +25,8 @@ class Entry(BaseModel):
             "content": content,
         }
 
+    def model_dump_json(self) -> str:
+        return orjson.dumps(self).decode()
+
     def __str__(self) -> str:
         return f"{self.author}: {self.body}"
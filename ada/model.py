@@ -1,6 +1,10 @@
 import os
+import shutil
+import subprocess
 import urllib.request
 
+from contextlib import suppress
+
 from prompt_toolkit.shortcuts import ProgressBar
 
 from ada.logger import build_logger
@@ -11,19 +15,21 @@ logger = build_logger(__name__)
 class Model:
     CACHE_DIR = "models"
     CHUNK_SIZE = 1024  # 1kb
+    PARTIAL_SUFFIX = ".part"  # downloads land here until complete
 
     def __init__(self, url: str):
         self.url: str = url
-        self.name: str = url.split("/")[-1]
+        self.name: str = url.partition("?")[0].rpartition("/")[2]
         logger.debug(f"using {self.name}")
         self.path: str = os.path.join(self.CACHE_DIR, self.name)
 
         self.__prepare()
 
     def __prepare(self) -> None:
-        os.makedirs(self.CACHE_DIR, exist_ok=True)
-
-        if not os.path.exists(self.path):
+        try:
+            os.stat(self.path)
+        except FileNotFoundError:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
             logger.info(f"downloading from {self.url}...")
             self.__download()
             logger.info(f"saved to {self.path}")
@@ -31,11 +37,55 @@ class Model:
             logger.info(f"exists at {self.path}")
 
     def __download(self) -> None:
+        """download beside the model, only a complete file is moved into place"""
+        partial = self.path + self.PARTIAL_SUFFIX
+        try:
+            aria2c = shutil.which("aria2c")
+            if aria2c is not None:
+                try:
+                    self.__download_with_aria2c(aria2c, partial)
+                except subprocess.CalledProcessError as e:
+                    logger.warning(f"{e}, retrying with urllib")
+                    self.__discard(partial)
+                    self.__download_with_urllib(partial)
+            else:
+                self.__download_with_urllib(partial)
+        except BaseException:
+            self.__discard(partial)
+            raise
+
+        os.replace(partial, self.path)
+
+    def __discard(self, partial: str) -> None:
+        """remove a partial download and the control file aria2c keeps beside it"""
+        for leftover in (partial, partial + ".aria2"):
+            with suppress(FileNotFoundError):
+                os.remove(leftover)
+
+    def __download_with_aria2c(self, aria2c: str, target: str) -> None:
+        """multi-connection download, aria2c renders its own progress"""
+        logger.info(f"downloading with {aria2c}")
+        subprocess.run(
+            [
+                aria2c,
+                "--max-connection-per-server=16",
+                "--split=16",
+                "--min-split-size=1M",
+                "--dir",
+                os.path.dirname(target),
+                "--out",
+                os.path.basename(target),
+                self.url,
+            ],
+            check=True,
+        )
+
+    def __download_with_urllib(self, target: str) -> None:
         with urllib.request.urlopen(self.url) as response:
             content_length = int(response.getheader("Content-Length", 0))
             total = round(content_length / self.CHUNK_SIZE)
 
-            with open(self.path, "wb") as f:
+            with open(target, "wb") as f:
                 # wrap an iterable that yields chunk sizes
                 def download_iterable():
                     while True:
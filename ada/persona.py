@@ -1,7 +1,6 @@
 import os
 
 from asyncio import Queue, AbstractEventLoop
-from functools import cached_property
 from pathlib import Path
 
 from ada.logger import build_logger
@@ -20,6 +19,7 @@ class Persona:
     WRAPPER_TAG = "memory"
     START_TAG = f"<{WRAPPER_TAG}>"
     END_TAG = f"</{WRAPPER_TAG}>"
+    MEMORY_TEMPLATE = f"{START_TAG}\n{{content}}{END_TAG}\n"
     INSTRUCTION = (
         f"IMPORTANT: Additional instructions are wrapped with {START_TAG}{END_TAG}"
     )
@@ -29,16 +29,26 @@ class Persona:
         self.description = description
         self.prompt = prompt
         self.watcher = None
+        self._cached_memories_val: str | None = None
+        self._cached_prompt_val: str | None = None
 
     def clear_cached_memories(self) -> None:
-        if hasattr(self, "_cached_memories"):
-            del self._cached_memories
+        self._cached_memories_val = None
+        self._cached_prompt_val = None
 
     def get_prompt(self) -> str:
+        prompt = self._cached_prompt_val
+        if prompt is None:
+            prompt = self.__build_prompt()
+            self._cached_prompt_val = prompt
+        return prompt
+
+    def __build_prompt(self) -> str:
         prompts = [self.prompt]
-        if len(self._cached_memories) > 0:
+        memories = self._cached_memories()
+        if len(memories) > 0:
             prompts.append("\n" + self.INSTRUCTION)
-            prompts.append(self._cached_memories)
+            prompts.append(memories)
 
         return "\n".join(prompts)
 
@@ -61,25 +71,20 @@ class Persona:
         return sorted([str(p) for p in self._memory_path().rglob("*") if p.is_file()])
 
     def _commands(self) -> list[str]:
-        memories = []
-        for path in self._get_memory_files():
-            with open(path, "r") as memory:
-                contents = memory.read()
-
-                if len(contents) > 0:
-                    if contents[-1] == "\n":
-                        padding = ""
-                    else:
-                        padding = "\n"
-
-                    memories.append(
-                        f"{self.START_TAG}\n{contents}{padding}{self.END_TAG}\n"
-                    )
-        return memories
+        contents = (Path(path).read_text() for path in self._get_memory_files())
+        return [self.__wrap(content) for content in contents if content]
+
+    def __wrap(self, content: str) -> str:
+        if not content.endswith("\n"):
+            content += "\n"
+        return self.MEMORY_TEMPLATE.format(content=content)
 
-    @cached_property
     def _cached_memories(self) -> str:
-        return "\n".join(self._commands())
+        memories = self._cached_memories_val
+        if memories is None:
+            memories = "\n".join(self._commands())
+            self._cached_memories_val = memories
+        return memories
 
     def __str__(self) -> str:
         return f"{self.name}: {self.description}"
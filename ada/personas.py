@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from ada.persona import Persona
 
 
@@ -37,18 +39,7 @@ Occasionally, speak in pig-latin.
         Returns:
             list[Persona]: A list of all Persona instances defined as class attributes
         """
-        personas = []
-        for attr_name in dir(cls):
-            # Skip private attributes and methods
-            if attr_name.startswith("_"):
-                continue
-
-            attr_value = getattr(cls, attr_name)
-            # Check if the attribute is a Persona instance
-            if isinstance(attr_value, Persona):
-                personas.append(attr_value)
-
-        return personas
+        return list(cls.__index().values())
 
     @classmethod
     def get(cls, name: str) -> Persona | None:
@@ -61,7 +52,26 @@ Occasionally, speak in pig-latin.
         Returns:
             Persona | None: The persona with the matching name, or None if not found
         """
-        for persona in cls.all():
-            if persona.name == name:
-                return persona
-        return None
+        return cls.__index().get(name)
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def __index(cls) -> dict[str, Persona]:
+        """
+        Index the persona constants by name, built once on first use.
+
+        Returns:
+            dict[str, Persona]: Persona instances keyed by their name
+        """
+        personas = {}
+        for attr_name in dir(cls):
+            # Skip private attributes and methods
+            if attr_name.startswith("_"):
+                continue
+
+            attr_value = getattr(cls, attr_name)
+            # Check if the attribute is a Persona instance
+            if isinstance(attr_value, Persona):
+                personas[attr_value.name] = attr_value
+
+        return personas
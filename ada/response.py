@@ -1,4 +1,6 @@
 import json
+import logging
+import orjson
 
 
 from ada.formatter import dump
@@ -9,6 +11,11 @@ logger = build_logger(__name__)
 
 NULL_OUTPUT = "DERP"
 
+# equivalent to json.dumps({"text": ...}) without building the wrapper dict,
+# the string itself goes through json.dumps to keep its \uXXXX escaping
+TEXT_PREFIX = '{"text": '
+TEXT_SUFFIX = "}"
+
 # create all the tool methods for the Agent to call
 for tool in ToolBox.tools:
     globals()[tool.name] = tool.create_global_function()
@@ -28,7 +35,9 @@ class Response:
 
     def __init__(self, source: dict) -> None:
         try:
-            logger.info("initialising response with \n" + dump(source))
+            # dump() pretty-prints the whole source, so skip it unless it's logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("initialising response with \n" + dump(source))
         except Exception as e:
             logger.error(f"{e}: error initialising response with {source}")
             raise e
@@ -41,11 +50,16 @@ class Response:
         return self.source["choices"][0]
 
     def __maybe_json(self, content: str) -> dict | str:
+        # only a JSON object is usable, so plain text never reaches the parser
+        if not content.lstrip().startswith("{"):
+            logger.info("content treated as a string")
+            return content
+
         try:
-            parsed = json.loads(content)
+            parsed = orjson.loads(content)
             logger.info("content parsed as json")
             return parsed
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.info("content treated as a string")
             return content
 
@@ -60,7 +74,7 @@ class Response:
 
                 if isinstance(parsed_content, str):
                     # cooerce string to dict just to simplify downstream processing
-                    content = json.dumps({"text": parsed_content})
+                    content = TEXT_PREFIX + json.dumps(parsed_content) + TEXT_SUFFIX
                     body = parsed_content
                 elif isinstance(parsed_content, dict):
                     content = raw_content
@@ -99,7 +113,7 @@ class Response:
         try:
             function_signature = tool_function["function"]
             function_name = function_signature["name"]
-            keyword_args = json.loads(function_signature["arguments"])
+            keyword_args = orjson.loads(function_signature["arguments"])
 
             logger.info(f"invoking {function_name} with {keyword_args}")
             function = globals()[function_name]
@@ -5,6 +5,8 @@ This module provides the Base class that all tools should inherit from.
 """
 
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from functools import partial
 from typing import Optional, Callable, Any
 
 
@@ -17,6 +19,16 @@ class Base(ABC):
     to implement their specific functionality.
     """
 
+    # tools live for the whole process, so skip the per-instance __dict__
+    __slots__ = (
+        "name",
+        "description",
+        "parameters",
+        "_definition",
+        "_required",
+        "_params",
+    )
+
     def __init__(
         self,
         name: str,
@@ -34,6 +46,9 @@ class Base(ABC):
         self.name = name
         self.description = description
         self.parameters = parameters or {}
+        self._definition: dict[str, Any] | None = None
+        self._required: tuple[str, ...] | None = None
+        self._params: str | None = None
 
     @abstractmethod
     def call(self, *args, **kwargs) -> Any:
@@ -56,10 +71,30 @@ class Base(ABC):
         """
         Get the tool's definition in the standard format.
 
+        The definition is built on first use and reused for every later
+        request; call clear_cached_definition() after mutating parameters.
+
         Returns:
             A dictionary containing the tool's definition in the standard format
         """
-        properties = self.parameters.get("properties", {})
+        if self._definition is None:
+            self._definition = self.__build_definition()
+        return self._definition
+
+    def clear_cached_definition(self) -> None:
+        """Drop the cached definition so it is rebuilt on the next request."""
+        self._definition = None
+        self._required = None
+        self._params = None
+
+    def __required(self) -> tuple[str, ...]:
+        if self._required is None:
+            self._required = tuple(self.parameters.get("properties", {}))
+        return self._required
+
+    def __build_definition(self) -> dict[str, Any]:
+        # snapshot, so the cache stays consistent if parameters change later
+        properties = deepcopy(self.parameters.get("properties", {}))
         return {
             "type": "function",
             "function": {
@@ -68,7 +103,7 @@ class Base(ABC):
                 "parameters": {
                     "type": "object",
                     "properties": properties,
-                    "required": list(properties.keys()),
+                    "required": list(properties),
                 },
             },
         }
@@ -77,36 +112,24 @@ class Base(ABC):
         """
         Create a global function for a tool instance.
 
+        The function is a partial over the bound call method, so invoking it
+        dispatches straight to call() without an extra Python frame.
+
         Returns:
             A callable function that can be used to call the tool
         """
-
-        def tool_function(*args, **kwargs):
-            """
-            Global function to call a tool.
-
-            This function is used by the LLM to call tools.
-            All arguments and keyword arguments are passed directly to the tool's call method.
-
-            Args:
-                *args: Positional arguments for the tool
-                **kwargs: Keyword arguments for the tool
-
-            Returns:
-                The result of the tool execution
-            """
-            return self.call(*args, **kwargs)
+        tool_function = partial(self.call)
 
         # Set the function name and docstring
-        tool_function.__name__ = self.name
+        tool_function.__name__ = self.name  # pyright: ignore[reportAttributeAccessIssue]
         tool_function.__doc__ = f"Global function to call the {self.name} tool."
 
         return tool_function
 
     def __params(self) -> str:
-        definition = self.definition()
-        params = definition["function"]["parameters"]["required"]
-        return ", ".join(params)
+        if self._params is None:
+            self._params = ", ".join(self.__required())
+        return self._params
 
     def __str__(self) -> str:
         return f"{self.name}({self.__params()}): {self.description}"
@@ -14,6 +14,8 @@ class ExampleTool(Base):
     This tool simply returns a greeting message with the provided name.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the example tool with predefined name, description, and parameters."""
         name = "example_tool"
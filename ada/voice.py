@@ -1,7 +1,12 @@
+import onnxruntime
 import os
 import pyaudio
+import threading
 import sounddevice  # https://stackoverflow.com/questions/36956083/how-can-the-terminal-output-of-executables-run-by-python-functions-be-silenced-i  # noqa: F401
 
+from asyncio import Future, get_running_loop, to_thread
+from collections import OrderedDict
+from functools import lru_cache, partial
 from piper import PiperVoice, SynthesisConfig
 from piper.download_voices import download_voice
 from pathlib import Path
@@ -11,52 +16,143 @@ from ada.logger import build_logger
 logger = build_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def cuda_available() -> bool:
+    """
+    Check whether ONNX Runtime can run Piper on a CUDA device.
+
+    Returns:
+        True if the CUDAExecutionProvider is available, False otherwise
+    """
+    try:
+        return "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+    except Exception as e:
+        logger.warning(f"unable to query onnxruntime providers: {e}")
+        return False
+
+
+@lru_cache(maxsize=8)
+def load_piper_voice(model_path: str, use_cuda: bool = False) -> PiperVoice:
+    """
+    Load a Piper voice model, shared by every Voice using the same file.
+
+    Args:
+        model_path: Path to the .onnx voice model
+        use_cuda: Whether to run inference on the GPU
+
+    Returns:
+        The loaded PiperVoice
+    """
+    logger.info(f"loading voice model {model_path}")
+    return PiperVoice.load(model_path, use_cuda=use_cuda)
+
+
 class Voice:
     CACHE_DIR = "voices"
+    FRAMES_PER_BUFFER = 1024  # frames requested per playback callback
+    SPOKEN_CACHE_SIZE = 32  # synthesized messages kept for replay
+    SAMPLE_CHANNELS = 1  # piper synthesizes mono
+    SAMPLE_WIDTH = 2  # as int16
+    DRAIN_MARGIN = 1.0  # seconds allowed beyond the queued audio's play time
+    DOWNLOAD_LOCK = threading.Lock()  # serializes prefetch and __init__ downloads
 
-    def __init__(self, voice: str):
+    # shared by every Voice, treat as read-only
+    SYNTHESIS_CONFIG = SynthesisConfig(
+        volume=1.0,  # loudness
+        length_scale=1.0,  # slowness
+        noise_scale=1.0,  # audio variation
+        noise_w_scale=1.0,  # speaking variation
+        normalize_audio=False,  # use raw audio from voice
+    )
+
+    def __init__(self, voice: str, use_cuda: bool | None = None):
         """
         Initialize Voice with a voice model identifier.
 
         Args:
             voice: Voice model identifier (e.g., "en_US-amy-medium")
+            use_cuda: Run synthesis on the GPU, None to auto-detect
         """
         self.voice: str = voice
-        logger.debug(f"using voice {self.voice}")
+        self.use_cuda: bool = cuda_available() if use_cuda is None else use_cuda
+        logger.debug(f"using voice {self.voice}, cuda: {self.use_cuda}")
 
-        self.__prepare()
+        self.__prepare(self.voice)
 
-        self.voice_config = SynthesisConfig(
-            volume=1.0,  # loudness
-            length_scale=1.0,  # slowness
-            noise_scale=1.0,  # audio variation
-            noise_w_scale=1.0,  # speaking variation
-            normalize_audio=False,  # use raw audio from voice
-        )
+        self.voice_config = self.SYNTHESIS_CONFIG
+
+        self.piper_voice = load_piper_voice(self.__get_model_path(), self.use_cuda)
+
+        # reused across say() calls until close()
+        self.audio: pyaudio.PyAudio | None = None
+        self.streams: dict[tuple[int, int, int], pyaudio.Stream] = {}
+        self.active: pyaudio.Stream | None = None  # the stream being fed
+        self.active_format: tuple[int, int, int] | None = None
+        self.spoken: OrderedDict[str, list[tuple[tuple[int, int, int], bytes]]] = (
+            OrderedDict()
+        )  # message -> synthesized audio, least recently used first
+
+        # audio queued for the playback callback, played up to self.played
+        self.pending = bytearray()
+        self.played = 0
+        self.playing = False  # whether the active stream is calling back
+        self.pending_lock = threading.Lock()
+        self.drained = threading.Event()
+        self.drained.set()
+
+        self.__preopen()
+
+    @classmethod
+    def prefetch(cls, voice: str) -> Future[None]:
+        """
+        Start downloading voice files on the default executor.
+
+        Lets the download overlap with other startup work. A Voice built
+        for the same identifier waits for an in-flight prefetch instead of
+        downloading again. Failures are logged, not raised, so Voice can
+        retry and surface the error itself.
+
+        Args:
+            voice: Voice model identifier (e.g., "en_US-amy-medium")
+
+        Returns:
+            A future that resolves once the voice files are present
+        """
+        return get_running_loop().run_in_executor(None, cls.__prefetch, voice)
 
-        # TODO: eventually need to move use_cuda to configuration or auto detection
-        # self.piper_voice = PiperVoice.load(self.__get_model_path(), use_cuda=True)
-        self.piper_voice = PiperVoice.load(self.__get_model_path())
+    @classmethod
+    def __prefetch(cls, voice: str) -> None:
+        try:
+            cls.__prepare(voice)
+        except Exception as e:
+            logger.warning(f"failed to prefetch voice {voice}: {e}")
 
-    def __prepare(self) -> None:
+    @classmethod
+    def __prepare(cls, voice: str) -> None:
         """Prepare the voices directory and download voice files if needed."""
-        os.makedirs(self.CACHE_DIR, exist_ok=True)
+        with cls.DOWNLOAD_LOCK:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
 
-        # Check if voice files already exist
-        if not self.__voice_exists():
-            logger.info(f"downloading voice {self.voice}...")
-            self.__download()
-            logger.info(f"voice {self.voice} saved to {self.CACHE_DIR}")
-        else:
-            logger.info(f"voice {self.voice} exists at {self.CACHE_DIR}")
+            # Check if voice files already exist
+            if not cls.__voice_exists(voice):
+                logger.info(f"downloading voice {voice}...")
+                cls.__download(voice)
+                logger.info(f"voice {voice} saved to {cls.CACHE_DIR}")
+            else:
+                logger.info(f"voice {voice} exists at {cls.CACHE_DIR}")
 
     def say(self, message: str) -> None:
         """
-        Synthesize and play audio message using PyAudio streaming.
+        Synthesize an audio message and queue it for playback.
 
-        Streams the synthesized audio from Piper directly to the speaker
-        without saving to disk. Each audio chunk is played immediately
-        as it's generated.
+        Audio chunks from Piper are appended to a buffer that the output
+        stream's callback drains on PortAudio's thread, so this returns as
+        soon as synthesis finishes rather than when playback does. Use
+        wait() to block until the speaker has caught up. The audio for the
+        last SPOKEN_CACHE_SIZE messages is kept, so repeated phrases skip
+        synthesis. The PyAudio instance and output streams are kept open
+        between calls; a failure closes them so the next call starts from a
+        clean device.
 
         Args:
             message: The text message to synthesize and play
@@ -65,65 +161,299 @@ class Voice:
             Exception: If audio playback fails
         """
         try:
-            p = pyaudio.PyAudio()
-            stream = None
-
-            try:
-                first_chunk = True
-
-                # Stream audio chunks from Piper
-                for chunk in self.piper_voice.synthesize(
-                    message, syn_config=self.voice_config
-                ):
-                    # Initialize the audio stream with the first chunk's properties
-                    if first_chunk:
-                        stream = p.open(
-                            format=p.get_format_from_width(chunk.sample_width),
-                            channels=chunk.sample_channels,
-                            rate=chunk.sample_rate,
-                            output=True,
-                        )
-                        logger.debug(
-                            f"opened audio stream: rate={chunk.sample_rate}, "
-                            f"channels={chunk.sample_channels}, "
-                            f"width={chunk.sample_width}"
-                        )
-                        first_chunk = False
-
-                    # Write audio data to the stream
-                    if stream:
-                        stream.write(chunk.audio_int16_bytes)
-
-            finally:
-                # Clean up resources
-                if stream is not None:
-                    stream.stop_stream()
-                    stream.close()
-                p.terminate()
+            cached = self.spoken.get(message)
+            if cached is not None:
+                self.spoken.move_to_end(message)
+                for audio_format, audio in cached:
+                    self.__enqueue(audio_format, audio)
+                return
+
+            # Queue audio chunks from Piper as they are synthesized
+            segments: list[tuple[tuple[int, int, int], bytes]] = []
+            for chunk in self.piper_voice.synthesize(
+                message, syn_config=self.voice_config
+            ):
+                audio_format = (
+                    chunk.sample_rate,
+                    chunk.sample_channels,
+                    chunk.sample_width,
+                )
+                self.__enqueue(audio_format, chunk.audio_int16_bytes)
+                segments.append((audio_format, chunk.audio_int16_bytes))
 
+            self.spoken[message] = segments
+            if len(self.spoken) > self.SPOKEN_CACHE_SIZE:
+                self.spoken.popitem(last=False)
         except Exception as e:
             logger.error(f"failed to play audio: {e}")
+            self.close()
             raise
 
-    def __voice_exists(self) -> bool:
+    async def say_async(self, message: str) -> None:
+        """
+        Run say() in a worker thread so Piper synthesis does not block the event loop.
+
+        Args:
+            message: The text message to synthesize and play
+        """
+        await to_thread(self.say, message)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until all queued audio has been handed to the output device.
+
+        Only the playback callback marks the buffer drained, so the wait is
+        always bounded: a stream that has stopped calling back returns at
+        once, and the default timeout is the queued audio's play time plus
+        DRAIN_MARGIN.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait as long as the
+                queued audio takes to play
+
+        Returns:
+            True if playback drained, False if it did not finish in time
+        """
+        if self.active is None:
+            return True
+
+        if not self.active.is_active():
+            logger.warning("audio stream is not active, queued audio will not play")
+            return self.drained.is_set()
+
+        if timeout is None:
+            timeout = self.__queued_seconds() + self.DRAIN_MARGIN
+
+        return self.drained.wait(timeout)
+
+    def close(self) -> None:
+        """Stop and close any open audio streams and release PyAudio."""
+        for stream in self.streams.values():
+            stream.stop_stream()
+            stream.close()
+        self.streams.clear()
+        self.active = None
+        self.active_format = None
+
+        with self.pending_lock:
+            self.pending.clear()
+            self.played = 0
+            self.playing = False
+            self.drained.set()
+
+        if self.audio is not None:
+            self.audio.terminate()
+            self.audio = None
+
+    def __activate(self, audio_format: tuple[int, int, int]) -> pyaudio.Stream:
+        """
+        Make the stream for an audio format the one the playback buffer feeds.
+
+        Audio already queued for a previous format is played out before
+        switching, so only one stream is ever running. Anything that did not
+        play in time is dropped rather than played at the wrong format. The
+        stream is started by __enqueue once there is audio for it.
+
+        Args:
+            audio_format: The (rate, channels, width) of the audio to play
+
+        Returns:
+            The now active output stream
+        """
+        stream = self.__stream(audio_format)
+        if stream is self.active:
+            return stream
+
+        if self.active is not None:
+            if not self.wait():
+                logger.warning("dropping audio that did not finish playing")
+                with self.pending_lock:
+                    self.pending.clear()
+                    self.played = 0
+                    self.drained.set()
+            self.active.stop_stream()
+            with self.pending_lock:
+                self.playing = False
+
+        self.active = stream
+        self.active_format = audio_format
+
+        return stream
+
+    def __queued_seconds(self) -> float:
+        """
+        Estimate how long the audio still queued will take to play.
+
+        Returns:
+            Seconds of audio not yet handed to the active stream
+        """
+        if self.active_format is None:
+            return 0.0
+
+        rate, channels, width = self.active_format
+        with self.pending_lock:
+            queued = len(self.pending) - self.played
+
+        return queued / (rate * channels * width)
+
+    def __playback(self, frame_bytes: int, in_data, frame_count, time_info, status):
+        """
+        PortAudio callback, feeds queued audio and pads underflow with silence.
+
+        Completes the stream once everything queued has played, so an idle
+        Voice holds no running stream; __enqueue restarts it.
+
+        Args:
+            frame_bytes: Bytes per frame for the stream's format
+            in_data: Unused, output only stream
+            frame_count: Number of frames requested
+            time_info: Unused
+            status: Unused
+
+        Returns:
+            A tuple of the audio bytes and pyaudio.paContinue, or
+            pyaudio.paComplete once the buffer has drained
+        """
+        wanted = frame_count * frame_bytes
+
+        with self.pending_lock:
+            # advance a read offset rather than shifting the buffer down each call,
+            # the buffer is only reset once everything queued has been played
+            start = self.played
+            end = min(start + wanted, len(self.pending))
+            with memoryview(self.pending) as view:
+                data = bytes(view[start:end])
+
+            drained = end == len(self.pending)
+            if drained:
+                self.pending.clear()
+                self.played = 0
+                self.playing = False
+                self.drained.set()
+            else:
+                self.played = end
+
+        if len(data) < wanted:
+            data += bytes(wanted - len(data))
+
+        return (data, pyaudio.paComplete if drained else pyaudio.paContinue)
+
+    def __preopen(self) -> None:
+        """
+        Open an output stream for the voice's native format ahead of the first say().
+
+        Takes device-open latency off the first response. Failure is not fatal,
+        say() opens a stream on demand.
+        """
+        try:
+            self.__open_stream(
+                self.piper_voice.config.sample_rate,
+                self.SAMPLE_CHANNELS,
+                self.SAMPLE_WIDTH,
+            )
+        except Exception as e:
+            logger.warning(f"unable to pre-open audio stream: {e}")
+
+    def __enqueue(self, audio_format: tuple[int, int, int], audio: bytes) -> None:
+        """
+        Queue audio for the playback callback on a stream matching its format.
+
+        Args:
+            audio_format: The (rate, channels, width) of the audio
+            audio: Raw int16 audio bytes
+        """
+        stream = self.__activate(audio_format)
+
+        with self.pending_lock:
+            self.pending.extend(audio)
+            self.drained.clear()
+            # decided under the lock the callback completes under, so a stream
+            # that is just finishing is never mistaken for a running one
+            start = not self.playing
+            self.playing = True
+
+        if start:
+            if not stream.is_stopped():
+                stream.stop_stream()  # completed streams must be stopped to restart
+            stream.start_stream()
+
+    def __stream(self, audio_format: tuple[int, int, int]) -> pyaudio.Stream:
+        """
+        Get an output stream for an audio format, opening one if needed.
+
+        Args:
+            audio_format: The (rate, channels, width) of the audio
+
+        Returns:
+            An open PyAudio output stream
+        """
+        stream = self.streams.get(audio_format)
+
+        if stream is None:
+            stream = self.__open_stream(*audio_format)
+
+        return stream
+
+    def __open_stream(self, rate: int, channels: int, width: int) -> pyaudio.Stream:
+        """
+        Open and cache a stopped, callback driven output stream for an audio format.
+
+        Args:
+            rate: Sample rate in Hz
+            channels: Number of channels
+            width: Sample width in bytes
+
+        Returns:
+            An open PyAudio output stream
+        """
+        if self.audio is None:
+            self.audio = pyaudio.PyAudio()
+
+        stream = self.audio.open(
+            format=self.audio.get_format_from_width(width),
+            channels=channels,
+            rate=rate,
+            output=True,
+            start=False,
+            frames_per_buffer=self.FRAMES_PER_BUFFER,
+            stream_callback=partial(self.__playback, channels * width),
+        )
+        logger.debug(
+            f"opened audio stream: rate={rate}, channels={channels}, width={width}"
+        )
+        self.streams[(rate, channels, width)] = stream
+
+        return stream
+
+    @classmethod
+    def __voice_exists(cls, voice: str) -> bool:
         """
         Check if voice model files exist in the cache directory.
 
+        Args:
+            voice: Voice model identifier
+
         Returns:
             True if both .onnx and .onnx.json files exist, False otherwise
         """
         # Voice files are named like: en_US-amy-medium.onnx and en_US-amy-medium.onnx.json
-        model_file = os.path.join(self.CACHE_DIR, f"{self.voice}.onnx")
-        config_file = os.path.join(self.CACHE_DIR, f"{self.voice}.onnx.json")
+        # one directory read instead of a stat per file
+        needed = {f"{voice}.onnx", f"{voice}.onnx.json"}
+        try:
+            with os.scandir(cls.CACHE_DIR) as entries:
+                found = {entry.name for entry in entries if entry.name in needed}
+        except FileNotFoundError:
+            return False
 
-        return os.path.exists(model_file) and os.path.exists(config_file)
+        return found == needed
 
-    def __download(self) -> None:
+    @classmethod
+    def __download(cls, voice: str) -> None:
         """Download voice model files from Hugging Face."""
         try:
-            download_voice(self.voice, Path(self.CACHE_DIR), force_redownload=False)
+            download_voice(voice, Path(cls.CACHE_DIR), force_redownload=False)
         except Exception as e:
-            logger.error(f"failed to download voice {self.voice}: {e}")
+            logger.error(f"failed to download voice {voice}: {e}")
             raise
 
     def __get_model_path(self) -> str:
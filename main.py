@@ -6,7 +6,19 @@ from ada.config import Config
 
 async def main():
     config = Config()
+
+    # download voice files while the backend loads
+    voice = config.voice()
+    prefetch = None
+    if voice:  # the same check Agent uses to build its Voice
+        from ada.voice import Voice  # only loaded when tts is enabled
+
+        prefetch = Voice.prefetch(voice)  # pyright: ignore[reportArgumentType] not bool under if
+
     agent = Agent(config=config)
+    if prefetch is not None:
+        await prefetch
+
     await agent.run(asyncio.get_running_loop())
 
 
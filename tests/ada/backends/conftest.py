@@ -0,0 +1,20 @@
+import ollama
+import pytest
+from unittest.mock import Mock
+
+
+@pytest.fixture(scope="session")
+def ollama_client():
+    """Mock ollama Client instance, built once for the whole session."""
+    return Mock(spec_set=ollama.Client)
+
+
+@pytest.fixture
+def mock_ollama_client(monkeypatch, ollama_client):
+    """Stub the ollama Client class with the shared mock, cleared for this test."""
+    monkeypatch.setattr(
+        "ada.backends.ollama_backend.ollama.Client",
+        lambda *args, **kwargs: ollama_client,
+    )
+    ollama_client.reset_mock(return_value=True, side_effect=True)
+    return ollama_client
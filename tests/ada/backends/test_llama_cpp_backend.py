@@ -93,9 +93,7 @@ def test_available_models(sample_config, mock_model, mock_llama):
     backend = LlamaCppBackend(sample_config)
 
     models = backend.available_models()
-    assert len(models) == 2
-    assert "test-model" in models
-    assert "another-model" in models
+    assert set(models) == {"test-model", "another-model"}
 
 
 def test_available_models_filters_invalid(mock_model, mock_llama):
@@ -112,9 +110,7 @@ def test_available_models_filters_invalid(mock_model, mock_llama):
     backend = LlamaCppBackend(config)
     models = backend.available_models()
 
-    assert len(models) == 2
-    assert "test-model" in models
-    assert "valid-model" in models
+    assert set(models) == {"test-model", "valid-model"}
 
 
 def test_chat_completion(sample_config, mock_model, mock_llama):
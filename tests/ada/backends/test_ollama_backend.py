@@ -1,27 +1,56 @@
+import os
+import socket
+from types import MappingProxyType
 from typing import cast
 from ollama._types import ChatResponse, Message
 
 import pytest
-from unittest.mock import Mock, patch
 from ada.backends.ollama_backend import OllamaBackend
 
 
-@pytest.fixture
-def sample_config():
-    """Sample configuration for ollama backend."""
-    return {
-        "model": "llama2",
-        "url": "http://localhost:11434",
-    }
+OLLAMA_OK = cast(
+    ChatResponse,
+    {
+        "message": {"role": "assistant", "content": "Hello!"},
+        "done": True,
+        "prompt_eval_count": 10,
+        "eval_count": 5,
+    },
+)
+
+# Tool calls are only read by _convert_response, so the tests can share them
+TOOL_CALL = Message.ToolCall(
+    function=Message.ToolCall.Function(name="test", arguments={})
+)
+TOOL_CALL_WEATHER = Message.ToolCall(
+    function=Message.ToolCall.Function(name="get_weather", arguments={"location": "SF"})
+)
+
 
+def ollama_running() -> bool:
+    """Check whether an Ollama server is listening on the default port."""
+    try:
+        with socket.create_connection(("localhost", 11434), timeout=0.1):
+            return True
+    except OSError:
+        return False
 
-@pytest.fixture
-def mock_ollama_client():
-    """Mock ollama Client class."""
-    with patch("ada.backends.ollama_backend.ollama.Client") as mock:
-        mock_instance = Mock()
-        mock.return_value = mock_instance
-        yield mock_instance
+
+requires_ollama = pytest.mark.skipif(
+    not os.environ.get("ADA_RUN_INTEGRATION") or not ollama_running(),
+    reason="requires ADA_RUN_INTEGRATION=1 and a local Ollama server",
+)
+
+
+@pytest.fixture(scope="session")
+def sample_config():
+    """Sample configuration for ollama backend, read-only so tests can share it."""
+    return MappingProxyType(
+        {
+            "model": "llama2",
+            "url": "http://localhost:11434",
+        }
+    )
 
 
 def test_ollama_backend_initialization(sample_config, mock_ollama_client):
@@ -70,10 +99,7 @@ def test_available_models_success(sample_config, mock_ollama_client):
     backend = OllamaBackend(sample_config)
     models = backend.available_models()
 
-    assert len(models) == 3
-    assert "llama2" in models
-    assert "mistral" in models
-    assert "codellama" in models
+    assert set(models) == {"llama2", "mistral", "codellama"}
     mock_ollama_client.list.assert_called_once()
 
 
@@ -95,25 +121,14 @@ def test_available_models_failure(sample_config, mock_ollama_client):
     models = backend.available_models()
 
     # Should return at least the configured model as fallback
-    assert len(models) == 1
-    assert "llama2" in models
+    assert models == ["llama2"]
 
 
 def test_chat_completion_without_tools(sample_config, mock_ollama_client):
     """Test chat_completion method without tools."""
     backend = OllamaBackend(sample_config)
 
-    ollama_response = cast(
-        ChatResponse,
-        {
-            "message": {"role": "assistant", "content": "Hello!"},
-            "done": True,
-            "prompt_eval_count": 10,
-            "eval_count": 5,
-        },
-    )
-
-    mock_ollama_client.chat.return_value = ollama_response
+    mock_ollama_client.chat.return_value = OLLAMA_OK
 
     messages = [{"role": "user", "content": "Hello"}]
     response = backend.chat_completion(messages)
@@ -133,16 +148,7 @@ def test_chat_completion_with_tools(sample_config, mock_ollama_client):
     backend = OllamaBackend(sample_config)
 
     tools = [{"type": "function", "function": {"name": "test_tool"}}]
-    ollama_response = cast(
-        ChatResponse,
-        {
-            "message": {"role": "assistant", "content": "Using tool"},
-            "done": True,
-            "prompt_eval_count": 10,
-            "eval_count": 5,
-        },
-    )
-    mock_ollama_client.chat.return_value = ollama_response
+    mock_ollama_client.chat.return_value = OLLAMA_OK
 
     messages = [{"role": "user", "content": "Test"}]
     response = backend.chat_completion(messages, tools=tools)
@@ -157,16 +163,13 @@ def test_chat_completion_with_json_format(sample_config, mock_ollama_client):
     """Test chat_completion with JSON response format."""
     backend = OllamaBackend(sample_config)
 
-    ollama_response = cast(
+    mock_ollama_client.chat.return_value = cast(
         ChatResponse,
         {
+            **OLLAMA_OK,
             "message": {"role": "assistant", "content": '{"key": "value"}'},
-            "done": True,
-            "prompt_eval_count": 10,
-            "eval_count": 5,
         },
     )
-    mock_ollama_client.chat.return_value = ollama_response
 
     messages = [{"role": "user", "content": "Test"}]
     response = backend.chat_completion(
@@ -174,6 +177,7 @@ def test_chat_completion_with_json_format(sample_config, mock_ollama_client):
     )
 
     assert "choices" in response
+    assert response["choices"][0]["message"]["content"] == '{"key": "value"}'
 
     call_args = mock_ollama_client.chat.call_args
     assert call_args.kwargs["format"] == "json"
@@ -194,21 +198,15 @@ def test_convert_response_with_tool_calls(sample_config, mock_ollama_client):
     """Test response conversion with tool calls."""
     backend = OllamaBackend(sample_config)
 
-    tool_call = Message.ToolCall(
-        function=Message.ToolCall.Function(name="test", arguments={})
-    )
-
     ollama_response = cast(
         ChatResponse,
         {
+            **OLLAMA_OK,
             "message": {
                 "role": "assistant",
                 "content": "Using tool",
-                "tool_calls": [tool_call],
+                "tool_calls": [TOOL_CALL],
             },
-            "done": True,
-            "prompt_eval_count": 10,
-            "eval_count": 5,
         },
     )
     openai_response = backend._convert_response(ollama_response)
@@ -235,6 +233,8 @@ def test_str_representation(sample_config, mock_ollama_client):
     assert "http://localhost:11434" in str(backend)
 
 
+@pytest.mark.integration
+@requires_ollama
 def test_chat_completion_with_gpt_oss():
     """Test chat_completion with gpt-oss model without mocks."""
     config = {
@@ -264,6 +264,8 @@ def test_chat_completion_with_gpt_oss():
     assert "total_tokens" in response["usage"]
 
 
+@pytest.mark.integration
+@requires_ollama
 def test_context_window_with_gpt_oss():
     """Test context_window retrieves value from Ollama model metadata."""
     config = {
@@ -286,192 +288,113 @@ def test_context_window_with_gpt_oss():
     assert context_size >= 2048
 
 
-def test_context_window_from_model_info_num_ctx(sample_config, mock_ollama_client):
-    """Test context_window extracts num_ctx from model_info."""
-    backend = OllamaBackend(sample_config)
-
-    # Mock client.show to return model_info with num_ctx
-    mock_ollama_client.show.return_value = {"model_info": {"num_ctx": 4096}}
-
-    context_size = backend.context_window()
-
-    assert context_size == 4096
-    mock_ollama_client.show.assert_called_once_with("llama2")
-
-
-def test_context_window_from_model_info_context_length(
-    sample_config, mock_ollama_client
-):
-    """Test context_window extracts context_length from model_info."""
-    backend = OllamaBackend(sample_config)
-
-    # Mock client.show to return model_info with context_length
-    mock_ollama_client.show.return_value = {"model_info": {"context_length": 8192}}
-
-    context_size = backend.context_window()
-
-    assert context_size == 8192
-    mock_ollama_client.show.assert_called_once_with("llama2")
-
-
-def test_context_window_from_parameters(sample_config, mock_ollama_client):
-    """Test context_window extracts num_ctx from parameters."""
+CTX_CASES = [
+    ({"model_info": {"num_ctx": 4096}}, 4096),
+    ({"model_info": {"context_length": 8192}}, 8192),
+    ({"parameters": {"num_ctx": "16384"}}, 16384),
+    (Exception("Connection error"), 2048),
+    (
+        {
+            "model_info": {"some_other_field": "value"},
+            "parameters": {"temperature": 0.7},
+        },
+        2048,
+    ),
+    ({"model_info": {}}, 2048),
+    ({"model_info": "not a dict"}, 2048),
+]
+
+
+@pytest.mark.parametrize(
+    "show_result,expected",
+    CTX_CASES,
+    ids=[
+        "model_info_num_ctx",
+        "model_info_context_length",
+        "parameters_num_ctx",
+        "show_fails",
+        "no_num_ctx",
+        "empty_model_info",
+        "non_dict_model_info",
+    ],
+)
+def test_context_window(sample_config, mock_ollama_client, show_result, expected):
+    """Test context_window reads the model metadata and falls back to 2048."""
     backend = OllamaBackend(sample_config)
 
-    # Mock client.show to return parameters with num_ctx
-    mock_ollama_client.show.return_value = {"parameters": {"num_ctx": "16384"}}
+    if isinstance(show_result, Exception):
+        mock_ollama_client.show.side_effect = show_result
+    else:
+        mock_ollama_client.show.return_value = show_result
 
     context_size = backend.context_window()
 
-    assert context_size == 16384
+    assert context_size == expected
     mock_ollama_client.show.assert_called_once_with("llama2")
 
 
-def test_context_window_fallback_when_show_fails(sample_config, mock_ollama_client):
-    """Test context_window returns 2048 when client.show fails."""
-    backend = OllamaBackend(sample_config)
-
-    # Mock client.show to raise exception
-    mock_ollama_client.show.side_effect = Exception("Connection error")
-
-    context_size = backend.context_window()
-
-    assert context_size == 2048
-
-
-def test_context_window_with_no_num_ctx(sample_config, mock_ollama_client):
-    """Test context_window returns 2048 when num_ctx not found."""
-    backend = OllamaBackend(sample_config)
-
-    # Mock client.show to return response without num_ctx
-    mock_ollama_client.show.return_value = {
-        "model_info": {"some_other_field": "value"},
-        "parameters": {"temperature": 0.7},
-    }
-
-    context_size = backend.context_window()
-
-    assert context_size == 2048
-
-
-def test_context_window_with_empty_model_info(sample_config, mock_ollama_client):
-    """Test context_window handles empty model_info."""
-    backend = OllamaBackend(sample_config)
-
-    # Mock client.show to return empty model_info
-    mock_ollama_client.show.return_value = {"model_info": {}}
-
-    context_size = backend.context_window()
-
-    assert context_size == 2048
-
-
-def test_context_window_with_non_dict_model_info(sample_config, mock_ollama_client):
-    """Test context_window handles non-dict model_info."""
-    backend = OllamaBackend(sample_config)
-
-    # Mock client.show to return non-dict model_info
-    mock_ollama_client.show.return_value = {"model_info": "not a dict"}
-
-    context_size = backend.context_window()
-
-    assert context_size == 2048
-
-
-def test_convert_response_with_missing_message(sample_config, mock_ollama_client):
-    """Test _convert_response handles missing message gracefully."""
-    backend = OllamaBackend(sample_config)
-
-    # Ollama response without message field
-    ollama_response = cast(
-        ChatResponse,
-        {
-            "done": True,
-            "prompt_eval_count": 10,
-            "eval_count": 5,
-        },
-    )
-
-    openai_response = backend._convert_response(ollama_response)
-
-    # Should have valid structure with empty/None content
-    assert "choices" in openai_response
-    assert len(openai_response["choices"]) == 1
-    assert "message" in openai_response["choices"][0]
-    assert openai_response["choices"][0]["message"]["role"] == "assistant"
-    assert openai_response["choices"][0]["message"]["content"] is None
-    assert "usage" in openai_response
-    assert openai_response["usage"]["total_tokens"] == 15
-
-
-def test_convert_response_with_zero_tokens(sample_config, mock_ollama_client):
-    """Test _convert_response handles zero token counts."""
-    backend = OllamaBackend(sample_config)
-
-    # Ollama response with zero tokens
-    ollama_response = cast(
-        ChatResponse,
+CONVERT_CASES = [
+    ({"done": True, "prompt_eval_count": 10, "eval_count": 5}, None, (10, 5, 15)),
+    (
         {
             "message": {"role": "assistant", "content": ""},
             "done": True,
             "prompt_eval_count": 0,
             "eval_count": 0,
         },
-    )
-
-    openai_response = backend._convert_response(ollama_response)
-
-    # Should calculate usage correctly
-    assert openai_response["usage"]["prompt_tokens"] == 0
-    assert openai_response["usage"]["completion_tokens"] == 0
-    assert openai_response["usage"]["total_tokens"] == 0
-
-
-def test_convert_response_with_missing_token_counts(sample_config, mock_ollama_client):
-    """Test _convert_response handles missing token counts."""
+        "",
+        (0, 0, 0),
+    ),
+    (
+        {"message": {"role": "assistant", "content": "test response"}, "done": True},
+        "test response",
+        (0, 0, 0),
+    ),
+    ({"message": {}, "done": True}, None, (0, 0, 0)),
+]
+
+
+@pytest.mark.parametrize(
+    "ollama_response,content,usage",
+    CONVERT_CASES,
+    ids=[
+        "missing_message",
+        "zero_tokens",
+        "missing_token_counts",
+        "empty_message_dict",
+    ],
+)
+def test_convert_response(
+    sample_config, mock_ollama_client, ollama_response, content, usage
+):
+    """Test _convert_response handles missing messages and token counts."""
     backend = OllamaBackend(sample_config)
 
-    # Ollama response without token count fields
-    ollama_response = cast(
-        ChatResponse,
-        {
-            "message": {"role": "assistant", "content": "test response"},
-            "done": True,
-        },
-    )
-
-    openai_response = backend._convert_response(ollama_response)
+    openai_response = backend._convert_response(cast(ChatResponse, ollama_response))
 
-    # Should default to 0 for missing counts
-    assert openai_response["usage"]["prompt_tokens"] == 0
-    assert openai_response["usage"]["completion_tokens"] == 0
-    assert openai_response["usage"]["total_tokens"] == 0
+    assert len(openai_response["choices"]) == 1
+    assert openai_response["choices"][0]["message"]["role"] == "assistant"
+    assert openai_response["choices"][0]["message"]["content"] == content
+    assert (
+        openai_response["usage"]["prompt_tokens"],
+        openai_response["usage"]["completion_tokens"],
+        openai_response["usage"]["total_tokens"],
+    ) == usage
 
 
 def test_convert_response_preserves_tool_calls(sample_config, mock_ollama_client):
     """Test _convert_response converts tool_calls to OpenAI format."""
     backend = OllamaBackend(sample_config)
 
-    # Ollama response with tool_calls (Message.ToolCall objects)
-    tool_calls = [
-        Message.ToolCall(
-            function=Message.ToolCall.Function(
-                name="get_weather", arguments={"location": "SF"}
-            )
-        )
-    ]
-
     ollama_response = cast(
         ChatResponse,
         {
+            **OLLAMA_OK,
             "message": {
                 "role": "assistant",
                 "content": "Let me check the weather",
-                "tool_calls": tool_calls,
+                "tool_calls": [TOOL_CALL_WEATHER],
             },
-            "done": True,
-            "prompt_eval_count": 20,
-            "eval_count": 10,
         },
     )
 
@@ -485,23 +408,3 @@ def test_convert_response_preserves_tool_calls(sample_config, mock_ollama_client
     assert tool_call["function"]["name"] == "get_weather"
     # Arguments should be JSON string in OpenAI format
     assert isinstance(tool_call["function"]["arguments"], str)
-
-
-def test_convert_response_with_empty_message_dict(sample_config, mock_ollama_client):
-    """Test _convert_response with empty message dictionary."""
-    backend = OllamaBackend(sample_config)
-
-    ollama_response = cast(
-        ChatResponse,
-        {
-            "message": {},
-            "done": True,
-        },
-    )
-
-    openai_response = backend._convert_response(ollama_response)
-
-    # Should handle gracefully
-    assert "choices" in openai_response
-    assert openai_response["choices"][0]["message"]["role"] == "assistant"
-    assert openai_response["choices"][0]["message"]["content"] is None
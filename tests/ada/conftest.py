@@ -0,0 +1,46 @@
+import pytest
+
+from ada.config import Config, freeze
+
+
+# read-only so the module-scoped fixtures can share it without copying
+EXAMPLE_CONFIG = freeze(
+    {
+        "log_level": "DEBUG",
+        "record": False,
+        "history": False,
+        "tts": "en_US-amy-medium",
+        "backend": "llama-cpp",
+        "backends": {
+            "llama-cpp": {
+                "model": "tiny-llm",
+                "threads": 4,
+                "verbose": False,
+                "models": [
+                    {
+                        "name": "tiny-llm",
+                        "url": "https://huggingface.co/mradermacher/Tiny-LLM-GGUF/resolve/main/Tiny-LLM.IQ4_XS.gguf",
+                    }
+                ],
+            },
+            "ollama": {
+                "url": "http://localhost:11434",
+                "model": "llama2",
+            },
+        },
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def example_config():
+    """Create a Config instance with mocked loaded data, shared by the module."""
+    config = Config.__new__(Config)
+    config.loaded = EXAMPLE_CONFIG
+    return config
+
+
+@pytest.fixture(scope="module")
+def example_file_config():
+    """Config loaded once from config.json.example, shared by the module."""
+    return Config("config.json.example")
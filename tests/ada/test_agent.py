@@ -1,15 +1,17 @@
-from ada import Agent
-from ada.config import Config
+import asyncio
 
-TEST_CONFIG_PATH = "tests/fixtures/config/test_runner.json"
+from ada import Agent
 
 
-def test_agent():
-    config = Config(path=TEST_CONFIG_PATH)
-    Agent(config=config)
+def test_agent(runner_config):
+    Agent(config=runner_config)
 
 
-def test_agent_say():
-    config = Config(path=TEST_CONFIG_PATH)
-    agent = Agent(config=config)
+def test_agent_say(runner_config):
+    agent = Agent(config=runner_config)
     agent.say("Hello World!")
+
+
+def test_agent_say_async(runner_config):
+    agent = Agent(config=runner_config)
+    asyncio.run(agent.say_async("Hello World!"))
@@ -1,89 +1,107 @@
 import logging
+import os
 import pytest
 
 from ada.config import Config
 
 
-EXAMPLE_CONFIG = {
-    "log_level": "DEBUG",
-    "record": False,
-    "history": False,
-    "tts": "en_US-amy-medium",
-    "backend": "llama-cpp",
-    "backends": {
-        "llama-cpp": {
-            "model": "tiny-llm",
-            "threads": 4,
-            "verbose": False,
-            "models": [
-                {
-                    "name": "tiny-llm",
-                    "url": "https://huggingface.co/mradermacher/Tiny-LLM-GGUF/resolve/main/Tiny-LLM.IQ4_XS.gguf",
-                }
-            ],
-        },
-        "ollama": {
-            "url": "http://localhost:11434",
-            "model": "llama2",
-        },
-    },
-}
-
-
-@pytest.fixture
-def example_config():
-    """Create a Config instance with mocked loaded data."""
-    config = Config.__new__(Config)
-    config.loaded = EXAMPLE_CONFIG
-    return config
-
-
 def tests_config():
     Config()
 
 
-def test_config_load_and_access_example():
-    config = Config("config.json.example")
+def test_config_load_and_access_example(example_file_config):
+    config = example_file_config
 
     assert config.log_level() == logging.DEBUG
     assert config.record()
     assert config.history()
 
 
-def test_backend_config_without_arguments(example_config):
-    """Test backend_config returns the configured backend when no argument is provided."""
-    # The mock config has "backend": "llama-cpp"
-    backend_config = example_config.backend_config()
+def test_config_load_is_cached():
+    """Test repeated Configs for the same file share one parsed dict."""
+    first = Config("config.json.example")
+    second = Config("config.json.example")
+
+    assert first.loaded is second.loaded
+
+
+def test_config_reloads_after_file_changes(tmp_path):
+    """Test an edited config file is parsed again."""
+    path = tmp_path / "config.json"
+    path.write_text('{"log_level": "DEBUG"}')
+    assert Config(str(path)).log_level() == logging.DEBUG
+
+    path.write_text('{"log_level": "ERROR"}')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert Config(str(path)).log_level() == logging.ERROR
+
+
+def test_config_reloads_after_rewrite_within_one_mtime_tick(tmp_path):
+    """Test a rewrite that keeps the modification time is still picked up."""
+    path = tmp_path / "config.json"
+    path.write_text('{"log_level": "DEBUG"}')
+    stat = path.stat()
+    assert Config(str(path)).log_level() == logging.DEBUG
+
+    path.write_text('{"log_level": "WARNING"}')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
 
-    # Should return llama-cpp configuration
-    assert "model" in backend_config
-    assert "models" in backend_config
-    assert backend_config["model"] == "tiny-llm"
-    assert isinstance(backend_config["models"], list)
+    assert Config(str(path)).log_level() == logging.WARNING
 
 
-def test_backend_config_with_llama_cpp_argument(example_config):
-    """Test backend_config with explicit 'llama-cpp' argument."""
-    backend_config = example_config.backend_config("llama-cpp")
+def test_config_loaded_is_read_only():
+    """Test the shared parsed config cannot be changed through one Config."""
+    config = Config("config.json.example")
+
+    with pytest.raises(TypeError):
+        config.loaded["log_level"] = "ERROR"  # pyright: ignore[reportIndexIssue]
+
+    with pytest.raises(TypeError):
+        config.backend_config()["model"] = "phi-2"  # pyright: ignore[reportIndexIssue]
+
+    assert Config("config.json.example").log_level() == logging.DEBUG
+
+
+# the example config is frozen, so its lists come back as tuples
+TINY_LLM_MODELS = (
+    {
+        "name": "tiny-llm",
+        "url": "https://huggingface.co/mradermacher/Tiny-LLM-GGUF/resolve/main/Tiny-LLM.IQ4_XS.gguf",
+    },
+)
+
+
+@pytest.mark.parametrize(
+    "backend,expected_model,expected_key,expected_value",
+    [
+        (None, "tiny-llm", "models", TINY_LLM_MODELS),
+        ("llama-cpp", "tiny-llm", "models", TINY_LLM_MODELS),
+        ("ollama", "llama2", "url", "http://localhost:11434"),
+    ],
+    ids=["without_arguments", "llama_cpp", "ollama"],
+)
+def test_backend_config(
+    example_config, backend, expected_model, expected_key, expected_value
+):
+    """Test backend_config resolves the configured or requested backend."""
+    # The mock config has "backend": "llama-cpp"
+    backend_config = example_config.backend_config(backend)
 
-    # Should return llama-cpp configuration
-    assert "model" in backend_config
-    assert "models" in backend_config
-    assert backend_config["model"] == "tiny-llm"
-    assert isinstance(backend_config["models"], list)
-    assert len(backend_config["models"]) > 0
-    assert backend_config["models"][0]["name"] == "tiny-llm"
+    assert backend_config["model"] == expected_model
+    assert backend_config[expected_key] == expected_value
 
 
-def test_backend_config_with_ollama_argument(example_config):
-    """Test backend_config with explicit 'ollama' argument."""
-    backend_config = example_config.backend_config("ollama")
+def test_backend_config_is_cached_until_reloaded():
+    """Test backend_config reuses the resolved section until loaded is replaced."""
+    config = Config.__new__(Config)
+    config.loaded = {"backends": {"llama-cpp": {"model": "tiny-llm"}}}
+    assert config.backend_config() is config.backend_config()
+
+    config.loaded = {"backends": {"llama-cpp": {"model": "phi-2"}}}
 
-    # Should return ollama configuration
-    assert "model" in backend_config
-    assert "url" in backend_config
-    assert backend_config["model"] == "llama2"
-    assert backend_config["url"] == "http://localhost:11434"
+    assert config.backend_config() == {"model": "phi-2"}
 
 
 def test_backend_config_with_invalid_backend(example_config):
@@ -126,3 +144,16 @@ def test_voice_with_blank_tts():
 
     voice = config.voice()
     assert voice is False
+
+
+def test_voice_cuda_defaults_to_auto_detect(example_config):
+    """Test voice_cuda() returns None when tts_cuda is not configured."""
+    assert example_config.voice_cuda() is None
+
+
+def test_voice_cuda_with_setting():
+    """Test voice_cuda() returns the configured tts_cuda flag."""
+    config = Config.__new__(Config)
+    config.loaded = {"log_level": "DEBUG", "tts_cuda": False}
+
+    assert config.voice_cuda() is False
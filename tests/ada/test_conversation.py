@@ -1,13 +1,25 @@
 import os
 import json
-import tempfile
+import gc
+import orjson
+import re
+import weakref
 
 from pathlib import Path
+
 from ada.conversation import Conversation
 from ada.entry import Entry
 from ada.response import Response
 
 
+RECORD_FILENAME = re.compile(r"\d+_[0-9a-f]{32}\.jsonl")
+
+
+def read_record(path: Path) -> list[dict]:
+    """Parse a JSON Lines record file into its entries"""
+    return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+
 def test_conversation():
     Conversation()
 
@@ -22,13 +34,12 @@ def test_conversation_initialization():
     assert conversation.record_path is None
 
 
-def test_conversation_initialization_record_enabled():
+def test_conversation_initialization_record_enabled(tmp_path):
     """Test that Conversation initializes file paths when recording"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        conversation = Conversation(record=True, storage_path=temp_dir)
-        assert conversation.record
-        assert conversation.storage_path is not None
-        assert conversation.record_path is not None
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
+    assert conversation.record
+    assert conversation.storage_path is not None
+    assert conversation.record_path is not None
 
 
 def test_conversation_append():
@@ -112,6 +123,17 @@ def test_conversation_messages():
     assert messages[1] == {"role": "user", "content": "Hi there!"}
 
 
+def test_conversation_messages_returns_a_copy():
+    """Test that callers can modify the returned messages without side effects"""
+    conversation = Conversation()
+    conversation.append("USER", "Hello")
+
+    messages = conversation.messages()
+    messages.insert(0, {"role": "system", "content": "prompt"})
+
+    assert conversation.messages() == [{"role": "user", "content": "Hello"}]
+
+
 def test_conversation_messages_empty():
     """Test getting messages from empty conversation"""
     conversation = Conversation()
@@ -146,113 +168,144 @@ def test_conversation_str_empty():
     assert "HISTORY END" in conversation_str
 
 
-def test_conversation_record_filename_format():
-    """Test that record filename follows timestamp-uuid.json format"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        conversation = Conversation(record=True, storage_path=temp_dir)
-
-        assert conversation.record_path is not None
-        filename = os.path.basename(conversation.record_path)
+def test_conversation_record_filename_format(tmp_path):
+    """Test that record filename follows timestamp_uuidhex.jsonl format"""
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
 
-        # Check format: timestamp-uuid.json
-        parts = filename.replace(".json", "").split("-")
-        assert len(parts) >= 2
+    assert conversation.record_path is not None
+    filename = os.path.basename(conversation.record_path)
 
-        # First part should be a timestamp (numeric)
-        assert parts[0].isdigit()
+    assert RECORD_FILENAME.fullmatch(filename)
 
-        # Last part should be a UUID (36 characters with hyphens)
-        uuid_part = "-".join(parts[1:])
-        assert len(uuid_part) == 36
-        assert uuid_part.count("-") == 4
 
-
-def test_conversation_record_json_creation():
+def test_conversation_record_json_creation(tmp_path, monkeypatch):
     """Test that JSON file is created only when an entry is added"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        conversation = Conversation(record=True, storage_path=temp_dir)
+    monkeypatch.setattr(Conversation, "FLUSH_THRESHOLD", 1)
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
 
-        # File should not exist after initialization
-        json_files = list(Path(temp_dir).glob("*.json"))
-        assert len(json_files) == 0
+    # File should not exist after initialization
+    json_files = list(tmp_path.glob("*.jsonl"))
+    assert len(json_files) == 0
 
-        # Add an entry
-        conversation.append("USER", "Hello")
-        json_files = list(Path(temp_dir).glob("*.json"))
-        assert len(json_files) == 1
+    # Add an entry
+    conversation.append("USER", "Hello")
+    json_files = list(tmp_path.glob("*.jsonl"))
+    assert len(json_files) == 1
 
-        # Check that file contains the entry
-        with open(json_files[0], "r") as f:
-            data = json.load(f)
-            assert len(data) == 1
-            assert data[0]["author"] == "USER"
-            assert data[0]["body"] == "Hello"
+    # Check that file contains the entry
+    data = read_record(json_files[0])
+    assert len(data) == 1
+    assert data[0]["author"] == "USER"
+    assert data[0]["body"] == "Hello"
 
 
-def test_conversation_record_json_updates():
+def test_conversation_record_json_updates(tmp_path, monkeypatch):
     """Test that JSON file is updated when entries are added"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        conversation = Conversation(record=True, storage_path=temp_dir)
-        # Add an entry
-        conversation.append("USER", "Hello")
-
-        json_file = list(Path(temp_dir).glob("*.json"))[0]
-        # Check that JSON file was updated
-        with open(json_file, "r") as f:
-            data = json.load(f)
-            assert len(data) == 1
-            assert data[0]["author"] == "USER"
-            assert data[0]["body"] == "Hello"
-
-        # Add another entry
-        conversation.append("ASSISTANT", "Hi there!")
-
-        # Check that JSON file was updated again
-        with open(json_file, "r") as f:
-            data = json.load(f)
-            assert len(data) == 2
-            assert data[1]["author"] == "ASSISTANT"
-            assert data[1]["body"] == "Hi there!"
-
-
-def test_conversation_record_response_json_updates():
+    monkeypatch.setattr(Conversation, "FLUSH_THRESHOLD", 1)
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
+    # Add an entry
+    conversation.append("USER", "Hello")
+
+    json_file = list(tmp_path.glob("*.jsonl"))[0]
+    # Check that JSON file was updated
+    data = read_record(json_file)
+    assert len(data) == 1
+    assert data[0]["author"] == "USER"
+    assert data[0]["body"] == "Hello"
+
+    # Add another entry
+    conversation.append("ASSISTANT", "Hi there!")
+
+    # Check that JSON file was updated again
+    data = read_record(json_file)
+    assert len(data) == 2
+    assert data[1]["author"] == "ASSISTANT"
+    assert data[1]["body"] == "Hi there!"
+
+
+def test_conversation_record_response_json_updates(tmp_path, monkeypatch):
     """Test that JSON file is updated when responses are added"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        conversation = Conversation(record=True, storage_path=temp_dir)
+    monkeypatch.setattr(Conversation, "FLUSH_THRESHOLD", 1)
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
+
+    # Create a mock response
+    response_source = {
+        "choices": [{"message": {"content": "I'm doing well!"}}],
+        "usage": {"total_tokens": 10},
+    }
+    response = Response(response_source)
+
+    # Add a response
+    conversation.append_response("ASSISTANT", response)
+
+    json_file = list(tmp_path.glob("*.jsonl"))[0]
 
-        # Create a mock response
-        response_source = {
-            "choices": [{"message": {"content": "I'm doing well!"}}],
-            "usage": {"total_tokens": 10},
-        }
-        response = Response(response_source)
+    # Check that JSON file was updated
+    data = read_record(json_file)
+    assert len(data) == 1
+    assert data[0]["author"] == "ASSISTANT"
+    assert data[0]["body"] == "I'm doing well!"
+    assert data[0]["role"] == "assistant"
+    assert data[0]["content"] is not None
 
-        # Add a response
-        conversation.append_response("ASSISTANT", response)
 
-        json_file = list(Path(temp_dir).glob("*.json"))[0]
+def test_conversation_record_buffers_until_flush(tmp_path):
+    """Test that entries are buffered until the threshold or an explicit flush"""
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
+    conversation.append("USER", "Hello")
+    conversation.append("ASSISTANT", "Hi")
+
+    # Nothing is written below the flush threshold
+    assert list(tmp_path.glob("*.jsonl")) == []
 
-        # Check that JSON file was updated
-        with open(json_file, "r") as f:
-            data = json.load(f)
-            assert len(data) == 1
-            assert data[0]["author"] == "ASSISTANT"
-            assert data[0]["body"] == "I'm doing well!"
-            assert data[0]["role"] == "assistant"
-            assert data[0]["content"] is not None
+    conversation.flush()
 
+    json_file = list(tmp_path.glob("*.jsonl"))[0]
+    data = read_record(json_file)
+    assert [entry["body"] for entry in data] == ["Hello", "Hi"]
 
-def test_conversation_record_clear_json_updates():
+
+def test_conversation_record_clear_json_updates(tmp_path, monkeypatch):
     """Test that JSON file is deleted when conversation is cleared"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        conversation = Conversation(record=True, storage_path=temp_dir)
-        # Add some entries
-        conversation.append("USER", "Hello")
-        conversation.append("ASSISTANT", "Hi")
-        json_file = list(Path(temp_dir).glob("*.json"))[0]
-
-        # Clear conversation
-        conversation.clear()
-
-        # Check that JSON file was deleted
-        assert not Path(json_file).exists()
+    monkeypatch.setattr(Conversation, "FLUSH_THRESHOLD", 1)
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
+    # Add some entries
+    conversation.append("USER", "Hello")
+    conversation.append("ASSISTANT", "Hi")
+    json_file = list(tmp_path.glob("*.jsonl"))[0]
+
+    # Clear conversation
+    conversation.clear()
+
+    # Check that JSON file was deleted
+    assert not json_file.exists()
+
+
+def test_conversation_record_clear_before_flush(tmp_path):
+    """Test that clearing drops buffered entries without writing them"""
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
+    conversation.append("USER", "Hello")
+
+    conversation.clear()
+    conversation.flush()
+
+    assert list(tmp_path.glob("*.jsonl")) == []
+
+
+def test_conversation_record_flushes_when_collected(tmp_path):
+    """Test that a dropped recording conversation is freed and saves its buffer"""
+    conversation = Conversation(record=True, storage_path=str(tmp_path))
+    conversation.append("USER", "Hello")
+    ref = weakref.ref(conversation)
+
+    del conversation
+    gc.collect()
+
+    assert ref() is None
+    json_file = list(tmp_path.glob("*.jsonl"))[0]
+    assert [entry["body"] for entry in read_record(json_file)] == ["Hello"]
+
+
+def test_conversation_flush_threshold_not_serialized():
+    """Test that the buffering threshold is not part of the dumped model"""
+    assert "FLUSH_THRESHOLD" not in Conversation().model_dump()
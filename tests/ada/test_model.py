@@ -1,7 +1,12 @@
+import pytest
+import subprocess
+
 from unittest.mock import patch
 from ada.model import Model
 
 TEST_MODEL_URL = "https://example.com/model.gguf"
+MODEL_PATH = "models/model.gguf"
+PARTIAL_PATH = "models/model.gguf.part"
 
 
 def test_model():
@@ -13,6 +18,14 @@ def test_model():
         assert model.path == "models/model.gguf"
 
 
+def test_model_name_ignores_query_string():
+    with patch("ada.model.Model._Model__prepare") as _prepare:
+        model = Model(url=f"{TEST_MODEL_URL}?download=true")
+
+        assert model.name == "model.gguf"
+        assert model.path == "models/model.gguf"
+
+
 def test_model_init_calls_prepare():
     with patch("ada.model.Model._Model__prepare") as prepare:
         Model(url=TEST_MODEL_URL)
@@ -22,16 +35,96 @@ def test_model_init_calls_prepare():
 def test_model_init_file_exists():
     with (
         patch("ada.model.Model._Model__download") as download,
-        patch("os.path.exists", return_value=True) as _exists,
+        patch("ada.model.os.stat") as _stat,
+        patch("ada.model.os.makedirs") as makedirs,
     ):
         Model(url=TEST_MODEL_URL)
         download.assert_not_called()
+        makedirs.assert_not_called()
 
 
 def test_model_init_file_does_not_exist():
     with (
         patch("ada.model.Model._Model__download") as download,
-        patch("os.path.exists", return_value=False) as _exists,
+        patch("ada.model.os.stat", side_effect=FileNotFoundError) as _stat,
+        patch("ada.model.os.makedirs") as _makedirs,
     ):
         Model(url=TEST_MODEL_URL)
         download.assert_called_once()
+
+
+def test_model_download_prefers_aria2c():
+    with (
+        patch("ada.model.Model._Model__download_with_urllib") as urllib_download,
+        patch("ada.model.shutil.which", return_value="/usr/bin/aria2c"),
+        patch("ada.model.subprocess.run") as run,
+        patch("ada.model.os.stat", side_effect=FileNotFoundError) as _stat,
+        patch("ada.model.os.makedirs") as _makedirs,
+        patch("ada.model.os.replace") as replace,
+    ):
+        Model(url=TEST_MODEL_URL)
+        urllib_download.assert_not_called()
+        run.assert_called_once()
+
+        args = run.call_args.args[0]
+        assert args[0] == "/usr/bin/aria2c"
+        assert args[-1] == TEST_MODEL_URL
+        assert args[args.index("--out") + 1] == "model.gguf.part"
+        replace.assert_called_once_with(PARTIAL_PATH, MODEL_PATH)
+
+
+def test_model_download_falls_back_to_urllib():
+    with (
+        patch("ada.model.Model._Model__download_with_urllib") as urllib_download,
+        patch("ada.model.shutil.which", return_value=None),
+        patch("ada.model.subprocess.run") as run,
+        patch("ada.model.os.stat", side_effect=FileNotFoundError) as _stat,
+        patch("ada.model.os.makedirs") as _makedirs,
+        patch("ada.model.os.replace") as replace,
+    ):
+        Model(url=TEST_MODEL_URL)
+        urllib_download.assert_called_once_with(PARTIAL_PATH)
+        run.assert_not_called()
+        replace.assert_called_once_with(PARTIAL_PATH, MODEL_PATH)
+
+
+def test_model_download_retries_with_urllib_when_aria2c_fails():
+    with (
+        patch("ada.model.Model._Model__download_with_urllib") as urllib_download,
+        patch("ada.model.shutil.which", return_value="/usr/bin/aria2c"),
+        patch(
+            "ada.model.subprocess.run",
+            side_effect=subprocess.CalledProcessError(1, "aria2c"),
+        ),
+        patch("ada.model.os.stat", side_effect=FileNotFoundError) as _stat,
+        patch("ada.model.os.makedirs") as _makedirs,
+        patch("ada.model.os.remove") as remove,
+        patch("ada.model.os.replace") as replace,
+    ):
+        Model(url=TEST_MODEL_URL)
+
+        # aria2c's partial file and control file are dropped before retrying
+        remove.assert_any_call(PARTIAL_PATH)
+        remove.assert_any_call(PARTIAL_PATH + ".aria2")
+        urllib_download.assert_called_once_with(PARTIAL_PATH)
+        replace.assert_called_once_with(PARTIAL_PATH, MODEL_PATH)
+
+
+def test_model_download_failure_discards_partial():
+    with (
+        patch(
+            "ada.model.Model._Model__download_with_urllib",
+            side_effect=OSError("connection reset"),
+        ),
+        patch("ada.model.shutil.which", return_value=None),
+        patch("ada.model.os.stat", side_effect=FileNotFoundError) as _stat,
+        patch("ada.model.os.makedirs") as _makedirs,
+        patch("ada.model.os.remove") as remove,
+        patch("ada.model.os.replace") as replace,
+    ):
+        with pytest.raises(OSError, match="connection reset"):
+            Model(url=TEST_MODEL_URL)
+
+        # nothing is left at the model path to pass as cached next time
+        remove.assert_any_call(PARTIAL_PATH)
+        replace.assert_not_called()
@@ -106,7 +106,7 @@ def test_persona_clear_cached_memories():
         prompt="This is a test.",
     )
 
-    persona._cached_memories = dedent("""
+    persona._cached_memories_val = dedent("""
             <memory>
             foo
             </memory>
@@ -126,3 +126,18 @@ def test_persona_clear_cached_memories():
 
     persona.clear_cached_memories()
     assert persona.get_prompt() == "This is a test."
+
+
+def test_persona_get_prompt_is_cached():
+    persona = Persona(
+        name="test",
+        description="A test persona.",
+        prompt="This is a test.",
+    )
+
+    with patch(
+        "ada.persona.Persona._memory_path", return_value=TEST_MEMORY_PATH
+    ) as _memory_path:
+        prompt = persona.get_prompt()
+        assert persona.get_prompt() is prompt
+        assert _memory_path.call_count == 1
@@ -18,3 +18,8 @@ def test_personas_get_found():
 
 def test_personas_get_not_found():
     assert Personas.get("notarealpersona") is None
+
+
+def test_personas_all_returns_a_new_list():
+    Personas.all().clear()
+    assert Personas.get("default") in Personas.all()
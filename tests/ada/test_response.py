@@ -35,6 +35,31 @@ def test_response_can_parse_simple_content():
     assert response.content == json.dumps({"result": "bar"})
 
 
+def test_response_treats_plain_text_as_text():
+    response = Response(
+        {
+            "choices": [{"message": {"content": "42 is the answer"}}],
+            "usage": {"total_tokens": 5},
+        }
+    )
+
+    assert response.body == "42 is the answer"
+    assert response.content == json.dumps({"text": "42 is the answer"})
+
+
+def test_response_escapes_non_ascii_text():
+    response = Response(
+        {
+            "choices": [{"message": {"content": "café ☕"}}],
+            "usage": {"total_tokens": 5},
+        }
+    )
+
+    assert response.body == "café ☕"
+    assert response.content == json.dumps({"text": "café ☕"})
+    assert response.content == '{"text": "caf\\u00e9 \\u2615"}'
+
+
 def test_response_can_parse_list_content():
     list = parse("llama/list.json")
     response = Response(list)
@@ -1,8 +1,25 @@
+import asyncio
+import gc
+import pyaudio
 import pytest
+import weakref
+from collections import namedtuple
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, Mock, patch
 
-from ada.voice import Voice
+from ada.voice import Voice, load_piper_voice
+
+# stands in for piper's AudioChunk, only the fields Voice reads
+AudioChunk = namedtuple(
+    "AudioChunk", "sample_rate sample_channels sample_width audio_int16_bytes"
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_pyaudio():
+    """Keep Voice off the real sound card, it pre-opens a stream when built."""
+    with patch("ada.voice.pyaudio.PyAudio") as mock:
+        yield mock
 
 
 @pytest.fixture
@@ -18,9 +35,27 @@ def temp_voice_dir(tmp_path, monkeypatch):
     voice_dir = tmp_path / "voices"
     voice_dir.mkdir()
     monkeypatch.setattr(Voice, "CACHE_DIR", str(voice_dir))
+    load_piper_voice.cache_clear()
     return voice_dir
 
 
+@pytest.fixture(scope="session")
+def shared_voice_dir(tmp_path_factory):
+    """Create a voices directory with en_US-amy-medium files, once per session."""
+    voice_dir = tmp_path_factory.mktemp("voices")
+    (voice_dir / "en_US-amy-medium.onnx").touch()
+    (voice_dir / "en_US-amy-medium.onnx.json").touch()
+    return voice_dir
+
+
+@pytest.fixture
+def cached_voice_dir(shared_voice_dir, monkeypatch):
+    """Point Voice at the shared directory where en_US-amy-medium is cached."""
+    monkeypatch.setattr(Voice, "CACHE_DIR", str(shared_voice_dir))
+    load_piper_voice.cache_clear()
+    return shared_voice_dir
+
+
 def test_voices_initialization(temp_voice_dir, mock_download_voice):
     """Test Voice initialization with a voice identifier."""
     with patch("ada.voice.PiperVoice"):
@@ -40,14 +75,8 @@ def test_voices_downloads_when_missing(temp_voice_dir, mock_download_voice):
         )
 
 
-def test_voices_skips_download_when_exists(temp_voice_dir, mock_download_voice):
+def test_voices_skips_download_when_exists(cached_voice_dir, mock_download_voice):
     """Test that Voice skips download when voice files already exist."""
-    # Create mock voice files
-    model_file = temp_voice_dir / "en_US-amy-medium.onnx"
-    config_file = temp_voice_dir / "en_US-amy-medium.onnx.json"
-    model_file.touch()
-    config_file.touch()
-
     with patch("ada.voice.PiperVoice"):
         Voice("en_US-amy-medium")
 
@@ -87,29 +116,28 @@ def test_voices_voice_exists_both_files_required(temp_voice_dir, mock_download_v
         mock_download_voice.assert_called_once()
 
 
-def test_voices_say_streams_audio(temp_voice_dir, mock_download_voice):
-    """Test that say() streams audio from Piper to PyAudio."""
-    # Create mock voice files
-    model_file = temp_voice_dir / "en_US-amy-medium.onnx"
-    config_file = temp_voice_dir / "en_US-amy-medium.onnx.json"
-    model_file.touch()
-    config_file.touch()
+def test_voices_can_be_collected(cached_voice_dir, mock_download_voice, mock_pyaudio):
+    """Test that nothing global keeps a dropped Voice and its streams alive."""
+    with patch("ada.voice.PiperVoice"):
+        voice = Voice("en_US-amy-medium")
+        ref = weakref.ref(voice)
+
+        del voice
+        mock_pyaudio.reset_mock()  # the mock remembers the stream callback
+        gc.collect()
+
+        assert ref() is None
+
 
+def test_voices_say_streams_audio(cached_voice_dir, mock_download_voice):
+    """Test that say() streams audio from Piper to PyAudio."""
     with patch("ada.voice.PiperVoice") as mock_piper_voice:
         # Mock the audio chunk
-        mock_chunk = type(
-            "AudioChunk",
-            (),
-            {
-                "sample_rate": 22050,
-                "sample_channels": 1,
-                "sample_width": 2,
-                "audio_int16_bytes": b"\x00\x00",
-            },
-        )()
+        mock_chunk = AudioChunk(22050, 1, 2, b"\x00\x00")
 
         # Mock the synthesize generator
         mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
         mock_piper_instance.synthesize.return_value = [mock_chunk]
 
         with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
@@ -123,73 +151,198 @@ def test_voices_say_streams_audio(temp_voice_dir, mock_download_voice):
 
             # Verify PyAudio was used correctly
             mock_p.open.assert_called_once()
-            mock_stream.write.assert_called_once_with(b"\x00\x00")
+            mock_stream.start_stream.assert_called_once()
+
+            # Verify the playback callback is fed the synthesized audio
+            playback = mock_p.open.call_args.kwargs["stream_callback"]
+            assert playback(None, 1, None, 0) == (b"\x00\x00", pyaudio.paComplete)
+            assert voice.wait(timeout=0)
+
+            # The stream stays open between calls
+            mock_stream.stop_stream.assert_not_called()
+            mock_p.terminate.assert_not_called()
+
+            voice.close()
             mock_stream.stop_stream.assert_called_once()
             mock_stream.close.assert_called_once()
             mock_p.terminate.assert_called_once()
 
 
-def test_voices_say_handles_multiple_chunks(temp_voice_dir, mock_download_voice):
-    """Test that say() handles multiple audio chunks correctly."""
-    # Create mock voice files
-    model_file = temp_voice_dir / "en_US-amy-medium.onnx"
-    config_file = temp_voice_dir / "en_US-amy-medium.onnx.json"
-    model_file.touch()
-    config_file.touch()
+def test_voices_say_reuses_stream(cached_voice_dir, mock_download_voice):
+    """Test that repeated say() calls reuse one PyAudio instance and stream."""
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        # Mock the audio chunk
+        mock_chunk = AudioChunk(22050, 1, 2, b"\x00\x00")
+
+        # Mock the synthesize generator
+        mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
+        mock_piper_instance.synthesize.return_value = [mock_chunk]
+
+        with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
+            mock_p = mock_pyaudio.return_value
+            mock_stream = mock_p.open.return_value
+            mock_p.get_format_from_width.return_value = 8
+
+            voice = Voice("en_US-amy-medium")
+            voice.say("Hello")
+            voice.say("World")
 
+            mock_pyaudio.assert_called_once()
+            mock_p.open.assert_called_once()
+            mock_stream.start_stream.assert_called_once()
+            assert voice.pending == b"\x00\x00\x00\x00"
+
+
+def test_voices_say_handles_multiple_chunks(cached_voice_dir, mock_download_voice):
+    """Test that say() handles multiple audio chunks correctly."""
     with patch("ada.voice.PiperVoice") as mock_piper_voice:
         # Mock multiple audio chunks
-        mock_chunk1 = type(
-            "AudioChunk",
-            (),
-            {
-                "sample_rate": 22050,
-                "sample_channels": 1,
-                "sample_width": 2,
-                "audio_int16_bytes": b"\x00\x01",
-            },
-        )()
-        mock_chunk2 = type(
-            "AudioChunk",
-            (),
-            {
-                "sample_rate": 22050,
-                "sample_channels": 1,
-                "sample_width": 2,
-                "audio_int16_bytes": b"\x02\x03",
-            },
-        )()
+        mock_chunk1 = AudioChunk(22050, 1, 2, b"\x00\x01")
+        mock_chunk2 = AudioChunk(22050, 1, 2, b"\x02\x03")
 
         # Mock the synthesize generator
         mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
         mock_piper_instance.synthesize.return_value = [mock_chunk1, mock_chunk2]
 
         with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
             # Setup PyAudio mock
             mock_p = mock_pyaudio.return_value
-            mock_stream = mock_p.open.return_value
             mock_p.get_format_from_width.return_value = 8
 
             voice = Voice("en_US-amy-medium")
             voice.say("Hello world, this is a longer message")
 
-            # Verify that write was called for both chunks
-            assert mock_stream.write.call_count == 2
-            mock_stream.write.assert_any_call(b"\x00\x01")
-            mock_stream.write.assert_any_call(b"\x02\x03")
+            # Verify that the callback plays both chunks in order
+            playback = mock_p.open.call_args.kwargs["stream_callback"]
+            assert playback(None, 1, None, 0) == (b"\x00\x01", pyaudio.paContinue)
+            assert not voice.wait(timeout=0)
+            assert playback(None, 1, None, 0) == (b"\x02\x03", pyaudio.paComplete)
+            assert voice.wait(timeout=0)
 
 
-def test_voices_say_error_handling(temp_voice_dir, mock_download_voice):
-    """Test that say() handles errors gracefully."""
-    # Create mock voice files
-    model_file = temp_voice_dir / "en_US-amy-medium.onnx"
-    config_file = temp_voice_dir / "en_US-amy-medium.onnx.json"
-    model_file.touch()
-    config_file.touch()
+def test_voices_playback_pads_underflow(temp_voice_dir, mock_download_voice):
+    """Test that the playback callback pads missing audio with silence."""
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_piper_voice.load.return_value.config.sample_rate = 22050
+
+        with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
+            mock_p = mock_pyaudio.return_value
+
+            voice = Voice("en_US-amy-medium")
+            voice.pending.extend(b"\x01\x02")
+
+            playback = mock_p.open.call_args.kwargs["stream_callback"]
+            assert playback(None, 2, None, 0) == (
+                b"\x01\x02\x00\x00",
+                pyaudio.paComplete,
+            )
+
+
+def test_voices_restarts_stream_after_draining(cached_voice_dir, mock_download_voice):
+    """Test that the stream stops once drained and restarts for the next message."""
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
+        mock_piper_instance.synthesize.return_value = [
+            AudioChunk(22050, 1, 2, b"\x00\x01")
+        ]
+
+        with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
+            mock_p = mock_pyaudio.return_value
+            mock_stream = mock_p.open.return_value
+
+            voice = Voice("en_US-amy-medium")
+            voice.say("Hello")
+
+            playback = mock_p.open.call_args.kwargs["stream_callback"]
+            assert playback(None, 1, None, 0)[1] == pyaudio.paComplete
+            assert not voice.playing
+
+            # a completed stream is not stopped yet and must be before restarting
+            mock_stream.is_stopped.return_value = False
+            voice.say("World")
+
+            mock_stream.stop_stream.assert_called_once()
+            assert mock_stream.start_stream.call_count == 2
+            assert voice.playing
+
+
+def test_voices_wait_returns_when_stream_stops(cached_voice_dir, mock_download_voice):
+    """Test that wait() does not block on a stream that no longer calls back."""
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
+        mock_piper_instance.synthesize.return_value = [
+            AudioChunk(22050, 1, 2, b"\x00\x01")
+        ]
+
+        with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
+            mock_stream = mock_pyaudio.return_value.open.return_value
+            mock_stream.is_active.return_value = False
+
+            voice = Voice("en_US-amy-medium")
+            voice.say("Hello world")
+
+            assert not voice.wait()
+
+
+def test_voices_wait_times_out_after_queued_audio(
+    cached_voice_dir, mock_download_voice, monkeypatch
+):
+    """Test that wait() gives up once the queued audio should have played."""
+    monkeypatch.setattr(Voice, "DRAIN_MARGIN", 0.0)
 
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
+        mock_piper_instance.synthesize.return_value = [
+            AudioChunk(22050, 1, 2, b"\x00\x01")
+        ]
+
+        with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
+            mock_stream = mock_pyaudio.return_value.open.return_value
+            mock_stream.is_active.return_value = True
+
+            voice = Voice("en_US-amy-medium")
+            voice.say("Hello world")
+
+            # the callback never runs, so the buffer is never drained
+            assert not voice.wait()
+
+
+def test_voices_format_switch_drops_unplayed_audio(
+    cached_voice_dir, mock_download_voice, monkeypatch
+):
+    """Test that switching formats does not hang on audio that never plays."""
+    monkeypatch.setattr(Voice, "DRAIN_MARGIN", 0.0)
+
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
+        mock_piper_instance.synthesize.return_value = [
+            AudioChunk(22050, 1, 2, b"\x00\x01"),
+            AudioChunk(16000, 1, 2, b"\x02\x03"),
+        ]
+
+        with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
+            # a distinct stream per format, none of which ever calls back
+            mock_pyaudio.return_value.open.side_effect = lambda **kwargs: Mock()
+
+            voice = Voice("en_US-amy-medium")
+            voice.say("Hello world")
+
+            assert voice.active_format == (16000, 1, 2)
+            assert voice.pending == b"\x02\x03"
+
+
+def test_voices_say_error_handling(cached_voice_dir, mock_download_voice):
+    """Test that say() handles errors gracefully."""
     with patch("ada.voice.PiperVoice") as mock_piper_voice:
         # Mock the synthesize to raise an error
         mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
         mock_piper_instance.synthesize.side_effect = Exception("Synthesis failed")
 
         with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
@@ -206,45 +359,168 @@ def test_voices_say_error_handling(temp_voice_dir, mock_download_voice):
             mock_p.terminate.assert_called_once()
 
 
-def test_voices_say_stream_cleanup_on_error(temp_voice_dir, mock_download_voice):
-    """Test that stream is properly cleaned up even if write fails."""
-    # Create mock voice files
-    model_file = temp_voice_dir / "en_US-amy-medium.onnx"
-    config_file = temp_voice_dir / "en_US-amy-medium.onnx.json"
-    model_file.touch()
-    config_file.touch()
-
+def test_voices_say_stream_cleanup_on_error(cached_voice_dir, mock_download_voice):
+    """Test that stream is properly cleaned up even if starting it fails."""
     with patch("ada.voice.PiperVoice") as mock_piper_voice:
         # Mock the audio chunk
-        mock_chunk = type(
-            "AudioChunk",
-            (),
-            {
-                "sample_rate": 22050,
-                "sample_channels": 1,
-                "sample_width": 2,
-                "audio_int16_bytes": b"\x00\x00",
-            },
-        )()
+        mock_chunk = AudioChunk(22050, 1, 2, b"\x00\x00")
 
         # Mock the synthesize generator
         mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
         mock_piper_instance.synthesize.return_value = [mock_chunk]
 
         with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
-            # Setup PyAudio mock with stream.write error
+            # Setup PyAudio mock with stream.start_stream error
             mock_p = mock_pyaudio.return_value
             mock_stream = mock_p.open.return_value
-            mock_stream.write.side_effect = Exception("Write failed")
+            mock_stream.start_stream.side_effect = Exception("Start failed")
             mock_p.get_format_from_width.return_value = 8
 
             voice = Voice("en_US-amy-medium")
 
             # Verify that the exception is raised
-            with pytest.raises(Exception, match="Write failed"):
+            with pytest.raises(Exception, match="Start failed"):
                 voice.say("Hello world")
 
             # Verify stream cleanup happens
             mock_stream.stop_stream.assert_called_once()
             mock_stream.close.assert_called_once()
             mock_p.terminate.assert_called_once()
+
+
+def test_voices_share_loaded_model(temp_voice_dir, mock_download_voice):
+    """Test that Voice instances for the same voice share one PiperVoice."""
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        first = Voice("en_US-amy-medium")
+        second = Voice("en_US-amy-medium")
+
+        mock_piper_voice.load.assert_called_once()
+        assert first.piper_voice is second.piper_voice
+
+
+def test_voices_prefetch_downloads_when_missing(temp_voice_dir, mock_download_voice):
+    """Test that prefetch() downloads missing voice files off the event loop."""
+
+    async def prefetch():
+        await Voice.prefetch("en_US-amy-medium")
+
+    asyncio.run(prefetch())
+
+    mock_download_voice.assert_called_once_with(
+        "en_US-amy-medium", Path(temp_voice_dir), force_redownload=False
+    )
+
+
+def test_voices_prefetch_logs_download_errors(temp_voice_dir, mock_download_voice):
+    """Test that prefetch() does not raise when the download fails."""
+    mock_download_voice.side_effect = Exception("Download failed")
+
+    async def prefetch():
+        await Voice.prefetch("en_US-amy-medium")
+
+    asyncio.run(prefetch())
+
+    mock_download_voice.assert_called_once()
+
+
+def test_voices_preopens_stream(temp_voice_dir, mock_download_voice):
+    """Test that the output stream is opened for the voice format at construction."""
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_piper_voice.load.return_value.config.sample_rate = 22050
+
+        with patch("ada.voice.pyaudio.PyAudio") as mock_pyaudio:
+            mock_p = mock_pyaudio.return_value
+            mock_p.get_format_from_width.return_value = 8
+
+            Voice("en_US-amy-medium")
+
+            mock_p.get_format_from_width.assert_called_once_with(2)
+            mock_p.open.assert_called_once_with(
+                format=8,
+                channels=1,
+                rate=22050,
+                output=True,
+                start=False,
+                frames_per_buffer=Voice.FRAMES_PER_BUFFER,
+                stream_callback=ANY,
+            )
+
+
+def test_voices_auto_detects_cuda(temp_voice_dir, mock_download_voice):
+    """Test that the GPU is used for synthesis when CUDA is available."""
+    with (
+        patch("ada.voice.PiperVoice") as mock_piper_voice,
+        patch("ada.voice.cuda_available", return_value=True),
+    ):
+        voice = Voice("en_US-amy-medium")
+
+        assert voice.use_cuda
+        mock_piper_voice.load.assert_called_once_with(ANY, use_cuda=True)
+
+
+def test_voices_cuda_override(temp_voice_dir, mock_download_voice):
+    """Test that an explicit use_cuda skips auto-detection."""
+    with (
+        patch("ada.voice.PiperVoice") as mock_piper_voice,
+        patch("ada.voice.cuda_available", return_value=True) as mock_cuda,
+    ):
+        voice = Voice("en_US-amy-medium", use_cuda=False)
+
+        assert not voice.use_cuda
+        mock_cuda.assert_not_called()
+        mock_piper_voice.load.assert_called_once_with(ANY, use_cuda=False)
+
+
+def test_voices_say_async_synthesizes(temp_voice_dir, mock_download_voice):
+    """Test that say_async() runs say() and queues the audio."""
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_chunk = AudioChunk(22050, 1, 2, b"\x00\x01")
+
+        mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
+        mock_piper_instance.synthesize.return_value = [mock_chunk]
+
+        with patch("ada.voice.pyaudio.PyAudio"):
+            voice = Voice("en_US-amy-medium")
+            asyncio.run(voice.say_async("Hello world"))
+
+            mock_piper_instance.synthesize.assert_called_once()
+            assert voice.pending == b"\x00\x01"
+
+
+def test_voices_say_replays_cached_audio(temp_voice_dir, mock_download_voice):
+    """Test that repeating a message reuses its audio instead of re-synthesizing."""
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_chunk = AudioChunk(22050, 1, 2, b"\x00\x01")
+
+        mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
+        mock_piper_instance.synthesize.return_value = [mock_chunk]
+
+        with patch("ada.voice.pyaudio.PyAudio"):
+            voice = Voice("en_US-amy-medium")
+            voice.say("Hello world")
+            voice.say("Hello world")
+
+            mock_piper_instance.synthesize.assert_called_once()
+            assert voice.pending == b"\x00\x01\x00\x01"
+
+
+def test_voices_say_evicts_least_recent(
+    temp_voice_dir, mock_download_voice, monkeypatch
+):
+    """Test that the spoken cache is bounded by SPOKEN_CACHE_SIZE."""
+    monkeypatch.setattr(Voice, "SPOKEN_CACHE_SIZE", 1)
+
+    with patch("ada.voice.PiperVoice") as mock_piper_voice:
+        mock_piper_instance = mock_piper_voice.load.return_value
+        mock_piper_instance.config.sample_rate = 22050
+        mock_piper_instance.synthesize.return_value = []
+
+        with patch("ada.voice.pyaudio.PyAudio"):
+            voice = Voice("en_US-amy-medium")
+            voice.say("first")
+            voice.say("second")
+
+            assert list(voice.spoken) == ["second"]
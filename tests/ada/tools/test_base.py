@@ -121,3 +121,25 @@ def test_create_global_function():
     # Test function call
     result = global_function("test_arg")
     assert result == "test_result"
+
+
+def test_definition_is_cached():
+    """Test that definition() reuses the same object until cleared."""
+    parameters = {"properties": {"arg1": {"type": "string"}}}
+    base = BaseImplementation("test_tool", "A test tool", parameters)
+
+    assert base.definition() is base.definition()
+
+    parameters["properties"]["arg2"] = {"type": "integer"}
+    parameters["properties"]["arg1"]["type"] = "integer"
+    cached = base.definition()["function"]["parameters"]
+    assert cached["properties"] == {"arg1": {"type": "string"}}
+    assert cached["required"] == ["arg1"]
+
+    base.clear_cached_definition()
+    rebuilt = base.definition()["function"]["parameters"]
+    assert rebuilt["properties"] == {
+        "arg1": {"type": "integer"},
+        "arg2": {"type": "integer"},
+    }
+    assert rebuilt["required"] == ["arg1", "arg2"]
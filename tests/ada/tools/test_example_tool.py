@@ -11,3 +11,10 @@ def test_example_tool_call():
     result = tool.call("Alice")
 
     assert result == "Hello, Alice! This is an example tool."
+
+
+def test_example_tool_has_no_instance_dict():
+    """Test ExampleTool keeps its state in slots."""
+    tool = ExampleTool()
+
+    assert not hasattr(tool, "__dict__")
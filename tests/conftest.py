@@ -0,0 +1,11 @@
+import pytest
+
+from ada.config import Config
+
+TEST_CONFIG_PATH = "tests/fixtures/config/test_runner.json"
+
+
+@pytest.fixture(scope="session")
+def runner_config():
+    """Config loaded once from the test runner fixture and shared by every test."""
+    return Config(path=TEST_CONFIG_PATH)
@@ -1,8 +1,16 @@
-import json
+import orjson
 
-FIXTURE_PATH = "tests/fixtures/"
+from functools import lru_cache
+from pathlib import Path
+
+FIXTURE_PATH = Path("tests/fixtures")
+
+
+@lru_cache(maxsize=None)
+def read(path: str) -> bytes:
+    return (FIXTURE_PATH / path).read_bytes()
 
 
 def parse(path: str) -> dict:
-    with open(FIXTURE_PATH + path, "r") as f:
-        return json.load(f)
+    # decode on every call so each test gets its own, freely mutable copy
+    return orjson.loads(read(path))